@@ -1,4 +1,3 @@
-import asyncio
 from typing import Any
 
 from langchain.chat_models import BaseChatModel
@@ -56,25 +55,25 @@ async def get_chat_history(
     run_config: dict[str, Any] | None = None,
 ) -> list[BaseMessage]:
     previous_messages = await database.get_messages(session_id)
-    recent_history: list[BaseMessage] = []
-    older_history: list[BaseMessage] = []
     if not previous_messages:
-        return recent_history
-
+        return []
+
+    conversation_messages = [
+        message
+        for message in previous_messages
+        if isinstance(message, (HumanMessage, AIMessage, ToolMessage))
+    ]
+    split_index = len(conversation_messages)
     conversation_turns = 5
-    for idx, message in enumerate(reversed(previous_messages), start=1):
-        if not isinstance(message, (HumanMessage, AIMessage, ToolMessage)):
-            continue
-
-        if conversation_turns > 0:
-            recent_history.insert(0, message)
-            if isinstance(message, HumanMessage):
-                conversation_turns -= 1
-        else:
-            older_history.insert(0, message)
+    for index in range(len(conversation_messages) - 1, -1, -1):
+        if conversation_turns <= 0:
+            break
+        split_index = index
+        if isinstance(conversation_messages[index], HumanMessage):
+            conversation_turns -= 1
 
-        if idx % 100 == 0:
-            await asyncio.sleep(0)
+    recent_history = conversation_messages[split_index:]
+    older_history = conversation_messages[:split_index]
 
     summary_message = await summarize_older_messages(older_history, model, run_config=run_config)
     if summary_message is not None:
@@ -34,6 +34,8 @@ class Agent:
             await self.__database.add_messages(self.__session_id, [no_idea_message])
             return {"messages": [no_idea_message]}
 
+        if self.__research_graph is None:
+            self.__research_graph = ResearchGraph(**self.__research_graph_kwargs)
         graph_result = await self.__research_graph.graph.ainvoke(
             {"research_idea": research_idea},
             config=self.__thread_config,
@@ -69,15 +71,17 @@ class Agent:
         self.__session_id = session_id
         self.__database = database
         self.__thread_config = build_langsmith_thread_config(session_id)
-        self.__research_graph = ResearchGraph(
-            session_id=session_id,
-            database=database,
-            browser=browser,
-            model_tier=model_tier,
-            research_breadth=research_breadth,
-            research_depth=research_depth,
-            document_length=document_length,
-        )
+        # Most chat turns never hand off, so the research graph and its models are built on demand.
+        self.__research_graph: ResearchGraph | None = None
+        self.__research_graph_kwargs = {
+            "session_id": session_id,
+            "database": database,
+            "browser": browser,
+            "model_tier": model_tier,
+            "research_breadth": research_breadth,
+            "research_depth": research_depth,
+            "document_length": document_length,
+        }
 
         @tool
         def handoff_to_research_graph(
@@ -1,11 +1,11 @@
-import operator
 from typing import Annotated, NotRequired, TypedDict
 
 from langchain_core.messages import BaseMessage
+from langgraph.graph.message import add_messages
 
 
 class AgentExecutionState(TypedDict):
-    messages: Annotated[list[BaseMessage], operator.add]
+    messages: Annotated[list[BaseMessage], add_messages]
     chat_history: NotRequired[list[BaseMessage]]
     research_idea: NotRequired[str]
     final_document: NotRequired[str]
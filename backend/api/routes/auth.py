@@ -2,7 +2,7 @@ import secrets
 import time
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import RedirectResponse
 
 from api.models import (
     AuthResponse,
@@ -19,7 +19,7 @@ from api.session import (
     get_current_user,
     set_auth_cookie,
 )
-from api.utils import normalize_email, oauth_error_redirect
+from api.utils import model_json_response, normalize_email, oauth_error_redirect
 from auth_service import FirebaseAuthError
 
 
@@ -48,7 +48,7 @@ async def auth_signup(request_body: SignupRequest, request: Request):
             provider=firebase_user.provider,
         )
         user = SessionUser(**user_record)
-        response = JSONResponse(AuthResponse(user=user).model_dump())
+        response = model_json_response(AuthResponse(user=user))
         set_auth_cookie(response, request, user)
         return response
     except FirebaseAuthError as error:
@@ -70,7 +70,7 @@ async def auth_login(request_body: LoginRequest, request: Request):
             provider=firebase_user.provider,
         )
         user = SessionUser(**user_record)
-        response = JSONResponse(AuthResponse(user=user).model_dump())
+        response = model_json_response(AuthResponse(user=user))
         set_auth_cookie(response, request, user)
         return response
     except FirebaseAuthError as error:
@@ -79,7 +79,7 @@ async def auth_login(request_body: LoginRequest, request: Request):
 
 @router.post("/logout", response_model=LogoutResponse)
 async def auth_logout(request: Request):
-    response = JSONResponse(LogoutResponse(ok=True).model_dump())
+    response = model_json_response(LogoutResponse(ok=True))
     clear_auth_cookie(response, request)
     return response
 
@@ -1,8 +1,9 @@
 import re
 
+from cachetools import TTLCache
 from fastapi import Request
 from langchain.chat_models import BaseChatModel
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from agent import build_research_handoff_context
 from nodes import Nodes
@@ -15,11 +16,40 @@ AUTO_RESEARCH_TRIGGER_PATTERN = re.compile(
     r"\b(research|deep\s*dive|analy[sz]e|analysis|compare|comparison|benchmark|report|whitepaper|citations?|sources?)\b",
     re.IGNORECASE,
 )
+AUTO_RESEARCH_DECISION_CACHE_SIZE = 512
+AUTO_RESEARCH_DECISION_CACHE_TTL_SECONDS = 900.0
 
 
 class AutoResearchDecision(BaseModel):
-    should_handoff: bool = False
-    confidence: float = 0.0
+    should_handoff: bool = Field(
+        default=False,
+        description="Whether the input should be handed off to the deep-research workflow.",
+    )
+    confidence: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1.0,
+        description="Confidence in the handoff decision, from 0.0 to 1.0.",
+    )
+
+
+# The decision prompt depends only on the user text, so resent or repeated inputs can reuse it.
+_auto_research_decisions: TTLCache[str, AutoResearchDecision] = TTLCache(
+    maxsize=AUTO_RESEARCH_DECISION_CACHE_SIZE,
+    ttl=AUTO_RESEARCH_DECISION_CACHE_TTL_SECONDS,
+)
+
+
+def _decision_cache_key(text: str) -> str:
+    return " ".join(text.split()).casefold()
+
+
+def _cached_auto_research_decision(key: str) -> AutoResearchDecision | None:
+    return _auto_research_decisions.get(key)
+
+
+def _store_auto_research_decision(key: str, decision: AutoResearchDecision) -> None:
+    _auto_research_decisions[key] = decision
 
 
 def parse_research_command(user_input: str) -> tuple[bool, str]:
@@ -63,17 +93,23 @@ async def maybe_auto_research_handoff_payload(
     if not looks_like_auto_research_candidate(trimmed):
         return None
 
-    decision_messages = Nodes().auto_research_handoff_decision_prompt(trimmed)
+    cache_key = _decision_cache_key(trimmed)
+    decision = _cached_auto_research_decision(cache_key)
+    if decision is None:
+        decision_messages = Nodes().auto_research_handoff_decision_prompt(trimmed)
 
-    try:
-        decision = await request.app.state.chat_model_mini.with_structured_output(
-            AutoResearchDecision
-        ).ainvoke(decision_messages, config=thread_config)
-    except Exception:
-        return None
+        try:
+            decision = await request.app.state.auto_research_decision_model.ainvoke(
+                decision_messages,
+                config=thread_config,
+            )
+        except Exception:
+            return None
+
+        if not isinstance(decision, AutoResearchDecision):
+            return None
+        _store_auto_research_decision(cache_key, decision)
 
-    if not isinstance(decision, AutoResearchDecision):
-        return None
     if not decision.should_handoff:
         return None
     if float(decision.confidence or 0.0) < 0.55:
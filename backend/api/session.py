@@ -6,7 +6,7 @@ import time
 from typing import Any
 
 from fastapi import HTTPException, Request
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import Response
 
 from api.models import SessionUser
 
@@ -64,7 +64,7 @@ def decode_session_token(token: str, secret: str) -> dict[str, Any]:
     return payload
 
 
-def set_auth_cookie(response: JSONResponse | RedirectResponse, request: Request, user: SessionUser) -> None:
+def set_auth_cookie(response: Response, request: Request, user: SessionUser) -> None:
     ttl = int(request.app.state.session_ttl_seconds)
     payload = {
         "sub": user.id,
@@ -87,7 +87,7 @@ def set_auth_cookie(response: JSONResponse | RedirectResponse, request: Request,
     )
 
 
-def clear_auth_cookie(response: JSONResponse, request: Request) -> None:
+def clear_auth_cookie(response: Response, request: Request) -> None:
     response.delete_cookie(
         key=request.app.state.cookie_name,
         domain=request.app.state.cookie_domain,
@@ -1,5 +1,6 @@
 from fastapi import HTTPException, Request
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, Response
+from pydantic import BaseModel
 
 
 def normalize_email(value: str) -> str:
@@ -21,3 +22,6 @@ def oauth_error_redirect(request: Request, message: str) -> RedirectResponse:
     frontend_base = request.app.state.frontend_base_url
     return RedirectResponse(url=f"{frontend_base}/login?error={message}", status_code=302)
 
+
+def model_json_response(model: BaseModel) -> Response:
+    return Response(content=model.model_dump_json(), media_type="application/json")
@@ -37,6 +37,11 @@ class FirebaseAuthService:
         self._google_redirect_uri = settings.google_oauth_redirect_uri
         self._frontend_base_url = settings.frontend_base_url
         self._request_timeout_seconds = settings.firebase_auth_timeout_seconds
+        # Keep connections to the Google auth endpoints alive between logins.
+        self._client = httpx.AsyncClient(timeout=httpx.Timeout(self._request_timeout_seconds))
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
 
     @staticmethod
     def _friendly_error(message: str) -> str:
@@ -53,8 +58,7 @@ class FirebaseAuthService:
 
     async def _identity_post(self, method: str, payload: dict[str, Any]) -> dict[str, Any]:
         url = f"https://identitytoolkit.googleapis.com/v1/{method}?key={self._firebase_api_key}"
-        async with httpx.AsyncClient(timeout=httpx.Timeout(self._request_timeout_seconds)) as client:
-            response = await client.post(url, json=payload)
+        response = await self._client.post(url, json=payload)
 
         if response.is_success:
             return response.json()
@@ -137,8 +141,7 @@ class FirebaseAuthService:
             "redirect_uri": self._google_redirect_uri,
             "grant_type": "authorization_code",
         }
-        async with httpx.AsyncClient(timeout=httpx.Timeout(self._request_timeout_seconds)) as client:
-            token_response = await client.post("https://oauth2.googleapis.com/token", data=token_payload)
+        token_response = await self._client.post("https://oauth2.googleapis.com/token", data=token_payload)
 
         if not token_response.is_success:
             raise FirebaseAuthError("Failed to exchange Google OAuth code.", status_code=400)
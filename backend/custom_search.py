@@ -1,12 +1,43 @@
+import asyncio
+import random
 from typing import Any, ClassVar
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import httpx
+from cachetools import TTLCache
 
 from settings import get_settings
 
+_TRACKING_QUERY_PARAMS = frozenset({"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "ref_src"})
+
+
+def normalize_url_key(url: str) -> str:
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url.strip()
+
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and parts.port not in {80, 443}:
+        host = f"{host}:{parts.port}"
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith("utm_") and key.lower() not in _TRACKING_QUERY_PARAMS
+        )
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(("", host, path, query, ""))
+
 
 class CustomSearch:
     _client: ClassVar[httpx.AsyncClient | None] = None
+    _request_slots: ClassVar[asyncio.Semaphore | None] = None
+    # Experts in one run often issue the same query; reuse results instead of spending quota.
+    _results_cache: ClassVar[TTLCache[tuple[str, int], dict[str, str]] | None] = None
 
     def __init__(self):
         settings = get_settings()
@@ -19,7 +50,18 @@ class CustomSearch:
                 timeout=httpx.Timeout(settings.custom_search_timeout_seconds)
             )
 
+        if CustomSearch._request_slots is None:
+            CustomSearch._request_slots = asyncio.Semaphore(settings.custom_search_max_concurrency)
+
         self.__client = CustomSearch._client
+        self.__request_slots = CustomSearch._request_slots
+        self.__max_retries = settings.custom_search_max_retries
+        if CustomSearch._results_cache is None and settings.custom_search_cache_ttl_seconds > 0:
+            CustomSearch._results_cache = TTLCache(
+                maxsize=512,
+                ttl=settings.custom_search_cache_ttl_seconds,
+            )
+        self.__results_cache = CustomSearch._results_cache
 
     @classmethod
     async def aclose(cls) -> None:
@@ -34,6 +76,11 @@ class CustomSearch:
         if not self.__search_engine_id:
             raise RuntimeError("Missing SEARCH_ENGINE_ID for Custom Search")
 
+        cache_key = (" ".join(query.split()).casefold(), int(num))
+        cached = self.__results_cache.get(cache_key) if self.__results_cache is not None else None
+        if cached is not None:
+            return dict(cached)
+
         params = {
             "key": self.__api_key,
             "cx": self.__search_engine_id,
@@ -44,8 +91,22 @@ class CustomSearch:
             "orTerms": "Research Paper|Article|Research Article|Research|Latest|News",
             "hl": "en",
         }
-        resp = await self.__client.get(self.__base_url, params=params)
-        resp.raise_for_status()
+        attempt = 0
+        while True:
+            try:
+                # Experts fan out many searches at once; cap the burst sent to the API.
+                async with self.__request_slots:
+                    resp = await self.__client.get(self.__base_url, params=params)
+                resp.raise_for_status()
+                break
+            except (httpx.TransportError, httpx.HTTPStatusError) as error:
+                retryable = not isinstance(error, httpx.HTTPStatusError) or (
+                    error.response.status_code == 429 or error.response.status_code >= 500
+                )
+                if not retryable or attempt >= self.__max_retries:
+                    raise
+                attempt += 1
+                await asyncio.sleep(0.5 * 2 ** (attempt - 1) + random.uniform(0.0, 0.25))
         search: dict[str, Any] = resp.json()
 
         if "items" not in search or not isinstance(search["items"], list):
@@ -53,11 +114,19 @@ class CustomSearch:
 
         items = search["items"]
         urls: dict[str, str] = {}
+        seen_keys: set[str] = set()
         for item in items:
             if not isinstance(item, dict):
                 continue
             link = item.get("link")
             title = item.get("title")
             if isinstance(link, str) and link and isinstance(title, str) and title:
+                url_key = normalize_url_key(link)
+                if url_key in seen_keys:
+                    continue
+                seen_keys.add(url_key)
                 urls[link] = title
+
+        if urls and self.__results_cache is not None:
+            self.__results_cache[cache_key] = dict(urls)
         return urls
@@ -1,14 +1,19 @@
+import asyncio
 import os
 from datetime import datetime, timezone
 from typing import Any
 
 from google.cloud.firestore import Client
+from langchain_core.documents import Document
 from langchain_google_firestore import FirestoreChatMessageHistory, FirestoreVectorStore
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 from settings import get_settings
 
+from .query_cache import SemanticQueryCache
+from .query_embeddings import QueryEmbeddingBatcher
+
 
 class DatabaseCommonMixin:
     def __init__(self):
@@ -28,18 +33,38 @@ class DatabaseCommonMixin:
 
         self._firestore_client = Client(project=project_id)
         self._embedding_model = GoogleGenerativeAIEmbeddings(
-            model="text-embedding-005",
+            model=settings.vector_embedding_model,
             vertexai=True,
             project=project_id,
             location=settings.google_cloud_location,
+            output_dimensionality=settings.vector_embedding_dimensions,
         )
+        self._query_embedder = QueryEmbeddingBatcher(self._embedding_model)
         self._splitter = RecursiveCharacterTextSplitter(
             chunk_size=settings.vector_split_chunk_size,
             chunk_overlap=settings.vector_split_chunk_overlap,
         )
+        self._vector_split_chunk_overlap = max(0, settings.vector_split_chunk_overlap)
+        self._vector_search_k = settings.vector_search_k
+        self._vector_search_fetch_k = max(settings.vector_search_fetch_k, settings.vector_search_k)
+        self._vector_search_use_mmr = settings.vector_search_use_mmr
+        self._vector_query_cache = (
+            SemanticQueryCache(
+                similarity_threshold=settings.vector_query_cache_similarity_threshold,
+                max_entries_per_session=settings.vector_query_cache_max_entries_per_session,
+                max_sessions=settings.vector_query_cache_max_sessions,
+                ttl_seconds=settings.vector_query_cache_ttl_seconds,
+            )
+            if settings.vector_query_cache_enabled
+            else None
+        )
+        self._vector_store: FirestoreVectorStore | None = None
+        self._vector_searches_in_flight: dict[tuple[str, str], asyncio.Task[list[Document]]] = {}
 
     async def chat(self, session_id: str) -> FirestoreChatMessageHistory:
-        return FirestoreChatMessageHistory(
+        # The constructor loads the history with a blocking Firestore read.
+        return await asyncio.to_thread(
+            FirestoreChatMessageHistory,
             session_id=session_id,
             collection="chats",
             client=self._firestore_client,
@@ -47,12 +72,22 @@ class DatabaseCommonMixin:
         )
 
     async def vector_store(self) -> FirestoreVectorStore:
-        vector_store = FirestoreVectorStore(
-            collection="vector",
-            embedding_service=self._embedding_model,
-            client=self._firestore_client,
-        )
-        return vector_store
+        # Stateless wrapper over the shared client; build it once per Database.
+        if self._vector_store is None:
+            self._vector_store = FirestoreVectorStore(
+                collection="vector",
+                embedding_service=self._embedding_model,
+                client=self._firestore_client,
+            )
+        return self._vector_store
+
+    async def warm_up(self) -> None:
+        # Pay the embedding client's auth and connection setup before the first user query.
+        try:
+            await self.vector_store()
+            await self._query_embedder.embed("warmup")
+        except Exception as error:
+            print(f"Vector search warm-up failed: {error}")
 
     @staticmethod
     def _as_datetime(value: Any) -> datetime | None:
@@ -0,0 +1,157 @@
+import time
+from typing import Any
+
+import numpy as np
+from cachetools import LRUCache, TTLCache
+from langchain_core.documents import Document
+
+
+class _SessionQueryCache:
+    __slots__ = (
+        "embeddings",
+        "scales",
+        "expires_at",
+        "results",
+        "size",
+        "next_slot",
+        "by_query",
+        "max_entries",
+        "ttl_seconds",
+    )
+
+    _INITIAL_CAPACITY = 16
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.embeddings: np.ndarray | None = None
+        self.scales: np.ndarray | None = None
+        self.expires_at: np.ndarray | None = None
+        self.results: list[list[Document]] = []
+        self.size = 0
+        self.next_slot = 0
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.by_query: TTLCache[str, list[Document]] = TTLCache(maxsize=max_entries, ttl=ttl_seconds)
+
+    def lookup_query(self, query_key: str) -> list[Document] | None:
+        documents = self.by_query.get(query_key)
+        if documents is None:
+            return None
+        return list(documents)
+
+    def add_query(self, query_key: str, documents: list[Document]) -> None:
+        self.by_query[query_key] = list(documents)
+
+    def lookup(self, query_vector: np.ndarray, similarity_threshold: float) -> list[Document] | None:
+        if self.size == 0 or self.embeddings.shape[1] != query_vector.shape[0]:
+            return None
+
+        scores = (self.embeddings[: self.size] @ query_vector) * self.scales[: self.size]
+        # Other workers write to the same sessions without invalidating this cache.
+        scores[self.expires_at[: self.size] <= time.monotonic()] = -np.inf
+        best_index = int(np.argmax(scores))
+        if float(scores[best_index]) < similarity_threshold:
+            return None
+        return list(self.results[best_index])
+
+    def add(self, query_vector: np.ndarray, documents: list[Document]) -> None:
+        max_entries = self.max_entries
+        dimensions = query_vector.shape[0]
+        if self.embeddings is None or self.embeddings.shape[1] != dimensions:
+            capacity = min(self._INITIAL_CAPACITY, max_entries)
+            self.embeddings = np.empty((capacity, dimensions), dtype=np.int8)
+            self.scales = np.empty(capacity, dtype=np.float32)
+            self.expires_at = np.empty(capacity, dtype=np.float64)
+            self.results = []
+            self.size = 0
+            self.next_slot = 0
+
+        if self.size < max_entries:
+            # Rows are preallocated and grown by doubling so inserts never copy the whole table.
+            if self.size == self.embeddings.shape[0]:
+                capacity = min(self.size * 2, max_entries)
+                grown = np.empty((capacity, dimensions), dtype=np.int8)
+                grown[: self.size] = self.embeddings
+                self.embeddings = grown
+                grown_scales = np.empty(capacity, dtype=np.float32)
+                grown_scales[: self.size] = self.scales
+                self.scales = grown_scales
+                grown_expires_at = np.empty(capacity, dtype=np.float64)
+                grown_expires_at[: self.size] = self.expires_at
+                self.expires_at = grown_expires_at
+            slot = self.size
+            self.size += 1
+            self.results.append(list(documents))
+        else:
+            # Full: overwrite the oldest row in place.
+            slot = self.next_slot
+            self.next_slot = (slot + 1) % self.size
+            self.results[slot] = list(documents)
+        # Rows are kept as int8 with a per-row scale: a quarter of the memory and
+        # well under 0.01 of cosine error, far inside the hit threshold margin.
+        scale = float(np.max(np.abs(query_vector))) / 127.0
+        self.embeddings[slot] = np.rint(query_vector / scale)
+        self.scales[slot] = scale
+        self.expires_at[slot] = time.monotonic() + self.ttl_seconds
+
+
+class SemanticQueryCache:
+    """Session-scoped vector search results keyed by query embedding similarity."""
+
+    def __init__(
+        self,
+        *,
+        similarity_threshold: float,
+        max_entries_per_session: int,
+        max_sessions: int,
+        ttl_seconds: float,
+    ):
+        self._similarity_threshold = float(similarity_threshold)
+        self._max_entries_per_session = max(1, int(max_entries_per_session))
+        self._ttl_seconds = max(1.0, float(ttl_seconds))
+        self._sessions: LRUCache[str, _SessionQueryCache] = LRUCache(maxsize=max(1, int(max_sessions)))
+
+    @staticmethod
+    def query_key(query: str) -> str:
+        return " ".join(str(query or "").split()).casefold()
+
+    @staticmethod
+    def normalize(embedding: Any) -> np.ndarray | None:
+        vector = np.asarray(embedding, dtype=np.float32)
+        if vector.ndim != 1 or vector.size == 0:
+            return None
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        return vector / norm
+
+    def session(self, session_id: str) -> _SessionQueryCache:
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            entry = _SessionQueryCache(self._max_entries_per_session, self._ttl_seconds)
+            self._sessions[session_id] = entry
+        return entry
+
+    def lookup_query(self, entry: _SessionQueryCache, query: str) -> list[Document] | None:
+        # Exact repeats skip the query embedding round trip as well as the search.
+        return entry.lookup_query(self.query_key(query))
+
+    def lookup(self, entry: _SessionQueryCache, query_vector: np.ndarray) -> list[Document] | None:
+        return entry.lookup(query_vector, self._similarity_threshold)
+
+    def store(
+        self,
+        session_id: str,
+        entry: _SessionQueryCache,
+        query: str,
+        query_vector: np.ndarray | None,
+        documents: list[Document],
+    ) -> None:
+        # A write invalidated the session while the search was in flight.
+        if self._sessions.get(session_id) is not entry:
+            return
+        entry.add_query(self.query_key(query), documents)
+        if query_vector is not None:
+            entry.add(query_vector, documents)
+
+    def invalidate(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
@@ -0,0 +1,70 @@
+import asyncio
+
+from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+
+class QueryEmbeddingBatcher:
+    """Coalesces concurrent query embeddings into a single embedding request."""
+
+    def __init__(
+        self,
+        embedding_model: GoogleGenerativeAIEmbeddings,
+        *,
+        window_seconds: float = 0.005,
+        max_batch_size: int = 100,
+    ):
+        self._embedding_model = embedding_model
+        self._window_seconds = max(0.0, float(window_seconds))
+        self._max_batch_size = max(1, int(max_batch_size))
+        self._pending: list[tuple[str, asyncio.Future[list[float]]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+
+    async def embed(self, text: str) -> list[float]:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[list[float]] = loop.create_future()
+        self._pending.append((text, future))
+        if len(self._pending) >= self._max_batch_size:
+            self._start_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._window_seconds, self._start_flush)
+        return await future
+
+    def _start_flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.create_task(self._flush(batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self, batch: list[tuple[str, asyncio.Future[list[float]]]]) -> None:
+        texts = list(dict.fromkeys(text for text, future in batch if not future.done()))
+        if not texts:
+            return
+
+        try:
+            if len(texts) == 1:
+                vectors = [await self._embedding_model.aembed_query(texts[0])]
+            else:
+                vectors = await self._embedding_model.aembed_documents(
+                    texts,
+                    task_type="RETRIEVAL_QUERY",
+                )
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        by_text = dict(zip(texts, vectors))
+        for text, future in batch:
+            if not future.done():
+                future.set_result(by_text[text])
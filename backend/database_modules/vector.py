@@ -2,12 +2,60 @@ import asyncio
 import json
 from typing import Any
 
+import numpy as np
 from google.cloud.firestore import FieldFilter
 from langchain_core.documents import Document
 from uuid_utils import uuid7
 
+from .query_cache import SemanticQueryCache
+
+
+def maximal_marginal_relevance(
+    query_embedding: Any,
+    candidate_embeddings: np.ndarray,
+    k: int,
+    lambda_mult: float = 0.5,
+) -> list[int]:
+    candidate_count = int(candidate_embeddings.shape[0]) if candidate_embeddings.ndim == 2 else 0
+    if candidate_count == 0 or k <= 0:
+        return []
+
+    query_vector = np.asarray(query_embedding, dtype=np.float32)
+    query_norm = float(np.linalg.norm(query_vector))
+    if query_norm > 0.0:
+        query_vector = query_vector / query_norm
+    norms = np.linalg.norm(candidate_embeddings, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    unit_candidates = candidate_embeddings / norms
+
+    query_scores = unit_candidates @ query_vector
+    pairwise_scores = unit_candidates @ unit_candidates.T
+
+    first_index = int(np.argmax(query_scores))
+    selected = [first_index]
+    max_redundancy = pairwise_scores[first_index].copy()
+    available = np.ones(candidate_count, dtype=bool)
+    available[first_index] = False
+
+    while len(selected) < min(k, candidate_count):
+        scores = lambda_mult * query_scores - (1.0 - lambda_mult) * max_redundancy
+        scores[~available] = -np.inf
+        next_index = int(np.argmax(scores))
+        selected.append(next_index)
+        available[next_index] = False
+        np.maximum(max_redundancy, pairwise_scores[next_index], out=max_redundancy)
+
+    return selected
+
 
 class DatabaseVectorMixin:
+    def _invalidate_vector_query_cache(self, session_id: str) -> None:
+        if self._vector_query_cache is not None:
+            self._vector_query_cache.invalidate(session_id)
+        # Searches already running may miss the write; later callers must not join them.
+        for key in [key for key in self._vector_searches_in_flight if key[0] == session_id]:
+            del self._vector_searches_in_flight[key]
+
     def _clear_vector_store_sync(self, session_id: str, batch_size: int = 5000) -> int | None:
         collection_ref = self._firestore_client.collection("vector")
         session_filter = FieldFilter("metadata.session_id", "==", session_id)
@@ -27,7 +75,10 @@ class DatabaseVectorMixin:
         return deleted
 
     async def clear_vector_store(self, session_id: str, batch_size: int = 5000) -> int | None:
-        return await asyncio.to_thread(self._clear_vector_store_sync, session_id, batch_size)
+        try:
+            return await asyncio.to_thread(self._clear_vector_store_sync, session_id, batch_size)
+        finally:
+            self._invalidate_vector_query_cache(session_id)
 
     def _delete_vector_source_sync(
         self,
@@ -75,26 +126,117 @@ class DatabaseVectorMixin:
 
         return deleted
 
+    def _stored_source_documents_sync(self, session_id: str, source_urls: list[str]) -> dict[str, Document]:
+        collection_ref = self._firestore_client.collection("vector")
+        session_filter = FieldFilter("metadata.session_id", "==", session_id)
+
+        chunks: dict[str, list[str]] = {}
+        metadata_by_source: dict[str, dict[str, Any]] = {}
+        # Firestore caps "in" filters at 30 values per query.
+        for start in range(0, len(source_urls), 30):
+            source_filter = FieldFilter("metadata.source", "in", source_urls[start : start + 30])
+            query = (
+                collection_ref.where(filter=session_filter)
+                .where(filter=source_filter)
+                .select(["content", "metadata"])
+            )
+            # Chunk ids are uuid7, so document-name order is the order they were split in.
+            for doc in query.stream():
+                payload = doc.to_dict() or {}
+                metadata = self._normalize_vector_metadata(payload.get("metadata"))
+                source = str(metadata.get("source") or "")
+                if not source:
+                    continue
+                content, metadata = self._extract_vector_page_content(payload.get("content"), metadata)
+                chunks.setdefault(source, []).append(str(content or "").strip())
+                metadata_by_source.setdefault(source, metadata)
+
+        return {
+            source: Document(
+                page_content=self._join_overlapping_chunks(
+                    chunks[source],
+                    self._vector_split_chunk_overlap,
+                ),
+                metadata=metadata_by_source[source],
+            )
+            for source in source_urls
+            if source in chunks
+        }
+
+    @staticmethod
+    def _join_overlapping_chunks(chunks: list[str], max_overlap: int) -> str:
+        # The splitter repeats up to chunk_overlap characters of whole words at
+        # each boundary; drop the longest repeated prefix that ends on a word.
+        joined = ""
+        for chunk in chunks:
+            if not chunk:
+                continue
+            if not joined:
+                joined = chunk
+                continue
+            overlap = 0
+            for size in range(min(max_overlap, len(joined), len(chunk)), 0, -1):
+                if (
+                    (size == len(chunk) or chunk[size].isspace())
+                    and (size == len(joined) or joined[-size - 1].isspace())
+                    and joined.endswith(chunk[:size])
+                ):
+                    overlap = size
+                    break
+            remainder = chunk[overlap:].strip()
+            if remainder:
+                joined = f"{joined}\n{remainder}"
+        return joined
+
+    async def stored_source_documents(self, session_id: str, source_urls: list[str]) -> dict[str, Document]:
+        unique_urls = list(dict.fromkeys(url for url in source_urls if url))
+        if not unique_urls:
+            return {}
+        return await asyncio.to_thread(self._stored_source_documents_sync, session_id, unique_urls)
+
     async def replace_source_data(
         self,
         session_id: str,
         source_url: str,
         documents: list[Document],
     ) -> None:
-        await asyncio.to_thread(
-            self._delete_vector_source_sync,
-            session_id,
-            source_url,
-        )
+        try:
+            await asyncio.to_thread(
+                self._delete_vector_source_sync,
+                session_id,
+                source_url,
+            )
+        finally:
+            self._invalidate_vector_query_cache(session_id)
         await self.add_data(session_id, documents)
 
+    @classmethod
+    async def _add_documents_bisecting(
+        cls,
+        vector_store: Any,
+        documents: list[Document],
+        ids: list[str],
+    ) -> int:
+        # Halve failing batches so one bad chunk costs O(log n) round trips, not n.
+        try:
+            await vector_store.aadd_documents(documents, ids=ids)
+            return len(documents)
+        except Exception:
+            if len(documents) <= 1:
+                return 0
+
+        middle = len(documents) // 2
+        added_count = await cls._add_documents_bisecting(vector_store, documents[:middle], ids[:middle])
+        added_count += await cls._add_documents_bisecting(vector_store, documents[middle:], ids[middle:])
+        return added_count
+
     async def add_data(self, session_id: str, documents: list[Document]) -> None:
         if not documents:
             print(f"No documents to add for session {session_id}.")
             return
 
         vector_store = await self.vector_store()
-        split_docs = self._splitter.split_documents(documents)
+        split_docs = await asyncio.to_thread(self._splitter.split_documents, documents)
         if not split_docs:
             print(f"Splitter returned no chunks for session {session_id}.")
             return
@@ -105,6 +247,18 @@ class DatabaseVectorMixin:
             split_doc.metadata = metadata
 
         ids = [str(uuid7()) for _ in range(len(split_docs))]
+        try:
+            await self._add_split_documents(session_id, vector_store, split_docs, ids)
+        finally:
+            self._invalidate_vector_query_cache(session_id)
+
+    async def _add_split_documents(
+        self,
+        session_id: str,
+        vector_store: Any,
+        split_docs: list[Document],
+        ids: list[str],
+    ) -> None:
         try:
             added = await vector_store.aadd_documents(split_docs, ids=ids)
             if isinstance(added, list) and len(added) == 0:
@@ -114,13 +268,15 @@ class DatabaseVectorMixin:
                 print(f"Added {added_count}/{len(split_docs)} vector chunks for session {session_id}.")
             return
         except Exception as bulk_error:
+            middle = len(split_docs) // 2
             added_count = 0
-            for doc, doc_id in zip(split_docs, ids):
-                try:
-                    await vector_store.aadd_documents([doc], ids=[doc_id])
-                    added_count += 1
-                except Exception:
-                    continue
+            if middle > 0:
+                added_count += await self._add_documents_bisecting(
+                    vector_store, split_docs[:middle], ids[:middle]
+                )
+                added_count += await self._add_documents_bisecting(
+                    vector_store, split_docs[middle:], ids[middle:]
+                )
 
             if added_count == 0:
                 raise bulk_error
@@ -188,6 +344,7 @@ class DatabaseVectorMixin:
         documents: list[Document],
     ) -> list[Document]:
         normalized_documents: list[Document] = []
+        seen_contents: set[str] = set()
         for document in documents:
             metadata = self._normalize_vector_metadata(getattr(document, "metadata", {}))
             page_content, metadata = self._extract_vector_page_content(
@@ -196,8 +353,9 @@ class DatabaseVectorMixin:
             )
 
             cleaned_content = str(page_content or "").strip()
-            if not cleaned_content:
+            if not cleaned_content or cleaned_content in seen_contents:
                 continue
+            seen_contents.add(cleaned_content)
 
             if not metadata.get("session_id"):
                 metadata["session_id"] = session_id
@@ -208,13 +366,88 @@ class DatabaseVectorMixin:
 
         return normalized_documents
 
+    @staticmethod
+    def _document_embedding(document: Document) -> list[float] | None:
+        metadata = document.metadata if isinstance(document.metadata, dict) else {}
+        embedding = metadata.get("embedding")
+        if isinstance(embedding, dict):
+            embedding = embedding.get("values")
+        if isinstance(embedding, list) and embedding:
+            return embedding
+        return None
+
+    def _mmr_rerank(self, query_embedding: list[float], candidates: list[Document]) -> list[Document]:
+        embedded = [
+            (document, embedding)
+            for document in candidates
+            if (embedding := self._document_embedding(document)) is not None
+        ]
+        if not embedded:
+            return candidates[: self._vector_search_k]
+
+        candidate_embeddings = np.asarray([embedding for _, embedding in embedded], dtype=np.float32)
+        selected = maximal_marginal_relevance(
+            query_embedding,
+            candidate_embeddings,
+            k=self._vector_search_k,
+        )
+        return [embedded[index][0] for index in selected]
+
     async def vector_search(self, session_id: str, query: str) -> list[Document]:
+        # Experts often issue the same lookup at the same moment; share one search.
+        key = (session_id, SemanticQueryCache.query_key(query))
+        search = self._vector_searches_in_flight.get(key)
+        if search is None:
+            search = asyncio.create_task(self._search_vector_store(session_id, query))
+            self._vector_searches_in_flight[key] = search
+
+            def _release(task: asyncio.Task[list[Document]]) -> None:
+                if self._vector_searches_in_flight.get(key) is task:
+                    del self._vector_searches_in_flight[key]
+                if not task.cancelled():
+                    task.exception()
+
+            search.add_done_callback(_release)
+        return list(await asyncio.shield(search))
+
+    async def _search_vector_store(self, session_id: str, query: str) -> list[Document]:
+        cache = self._vector_query_cache
+        cache_entry = None
+        if cache is not None:
+            cache_entry = cache.session(session_id)
+            cached_documents = cache.lookup_query(cache_entry, query)
+            if cached_documents is not None:
+                return cached_documents
+
+        query_embedding = await self._query_embedder.embed(query)
+
+        query_vector = None
+        if cache is not None and cache_entry is not None:
+            query_vector = cache.normalize(query_embedding)
+            if query_vector is not None:
+                cached_documents = cache.lookup(cache_entry, query_vector)
+                if cached_documents is not None:
+                    return cached_documents
+
         vector_store = await self.vector_store()
         session_filter = FieldFilter("metadata.session_id", "==", session_id)
-        documents = await vector_store.amax_marginal_relevance_search(
-            query=query,
-            k=5,
-            fetch_k=50,
-            filters=session_filter,
+        if self._vector_search_use_mmr:
+            candidates = await vector_store.asimilarity_search_by_vector(
+                query_embedding,
+                k=self._vector_search_fetch_k,
+                filters=session_filter,
+            )
+            documents = self._mmr_rerank(query_embedding, candidates)
+        else:
+            documents = await vector_store.asimilarity_search_by_vector(
+                query_embedding,
+                k=self._vector_search_k,
+                filters=session_filter,
+            )
+        normalized_documents = self._normalize_vector_documents(
+            session_id=session_id,
+            documents=documents,
         )
-        return self._normalize_vector_documents(session_id=session_id, documents=documents)
+        if cache is not None and cache_entry is not None:
+            cache.store(session_id, cache_entry, query, query_vector, normalized_documents)
+        return normalized_documents
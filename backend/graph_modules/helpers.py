@@ -1,4 +1,8 @@
 from langchain_core.messages import AIMessage
+from langchain_core.runnables import Runnable
+from openai import RateLimitError
+
+RATE_LIMIT_RETRY_ATTEMPTS = 8
 
 
 def expert_count_for_breadth(research_breadth: str) -> int:
@@ -33,6 +37,14 @@ def is_structured_output_error(error: Exception) -> bool:
     )
 
 
+def with_rate_limit_retry(runnable: Runnable) -> Runnable:
+    return runnable.with_retry(
+        retry_if_exception_type=(RateLimitError,),
+        wait_exponential_jitter=True,
+        stop_after_attempt=RATE_LIMIT_RETRY_ATTEMPTS,
+    )
+
+
 def fallback_section_text(section_title: str) -> str:
     return f"Could not generate section content for '{section_title}' due to repeated generation failures."
 
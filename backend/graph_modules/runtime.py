@@ -1,5 +1,5 @@
 import asyncio
-from typing import Any
+from typing import Any, ClassVar
 
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_openai import ChatOpenAI
@@ -9,9 +9,11 @@ from playwright.async_api import Browser
 from database import Database
 from nodes import Nodes
 from settings import build_langsmith_thread_config, get_settings
+from shared_models import get_summary_model
+from structures import ContentSection, Perspectives
 from tools import Tools
 
-from .helpers import expert_count_for_breadth
+from .helpers import expert_count_for_breadth, with_rate_limit_retry
 from .runtime_modules.callbacks import emit_progress, emit_state_checkpoint
 from .runtime_modules.node_final_sections import run_final_section_generation
 from .runtime_modules.node_outline import run_generate_document_outline
@@ -41,6 +43,8 @@ class ResearchGraph:
         "generate_content_for_perspectives",
         "final_section_generation",
     )
+    _repair_limiters: ClassVar[dict[str, asyncio.Semaphore]] = {}
+    _repair_limiters_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
 
     def __init__(
         self,
@@ -70,7 +74,7 @@ class ResearchGraph:
             use_responses_api=True,
             timeout=600.0,
         )
-        self.__summary_model = ChatGoogleGenerativeAI(model="models/gemini-flash-lite-latest")
+        self.__summary_model = get_summary_model()
         self.__progress_callback = progress_callback
         self.__callback_timeout_seconds = max(
             1.0,
@@ -102,6 +106,13 @@ class ResearchGraph:
             use_responses_api=True,
             timeout=600.0,
         )
+        self.__perspectives_model = self.__gemini_model.with_structured_output(
+            Perspectives,
+            method="json_schema",
+        )
+        self.__final_section_model = with_rate_limit_retry(
+            self.__final_content_model.with_structured_output(ContentSection, method="json_schema")
+        )
         self.__section_attempt_timeout_seconds = 900.0
         self.__section_retry_delays = (0.5, 1.0)
         self.__visual_repair_enabled = bool(settings.visual_repair_enabled)
@@ -110,6 +121,11 @@ class ResearchGraph:
             1.0,
             float(settings.visual_repair_retry_timeout_seconds),
         )
+        self.__visual_repair_concurrency_per_session = max(
+            1,
+            int(settings.visual_repair_concurrency_per_session),
+        )
+        self.__session_id = session_id
         self.__visual_tier2_enabled = bool(settings.visual_tier2_enabled)
         self.__visual_tier2_fail_open = bool(settings.visual_tier2_fail_open)
         self.__visual_tier2_validator = PlaywrightVisualTier2Validator(
@@ -281,10 +297,30 @@ class ResearchGraph:
             outline_str=outline_str,
             summary=summary,
             node_builder=self.__node,
-            final_content_model=self.__final_content_model,
+            final_section_model=self.__final_section_model,
             run_config=self.__thread_config,
         )
 
+    @classmethod
+    async def _get_repair_limiter(cls, session_id: str, concurrency: int) -> asyncio.Semaphore:
+        async with cls._repair_limiters_lock:
+            limiter = cls._repair_limiters.get(session_id)
+            if limiter is None:
+                limiter = asyncio.Semaphore(concurrency)
+                cls._repair_limiters[session_id] = limiter
+            return limiter
+
+    @classmethod
+    async def clear_repair_limiters(cls) -> None:
+        async with cls._repair_limiters_lock:
+            cls._repair_limiters.clear()
+
+    async def __repair_limiter(self) -> asyncio.Semaphore:
+        return await self._get_repair_limiter(
+            session_id=self.__session_id,
+            concurrency=self.__visual_repair_concurrency_per_session,
+        )
+
     async def __repair_section_visualizations(self, section):
         return await repair_section_visualizations(
             section,
@@ -296,6 +332,7 @@ class ResearchGraph:
             tier2_validator=self.__visual_tier2_validator,
             tier2_enabled=self.__visual_tier2_enabled,
             tier2_fail_open=self.__visual_tier2_fail_open,
+            repair_limiter=await self.__repair_limiter(),
             run_config=self.__thread_config,
         )
 
@@ -310,6 +347,7 @@ class ResearchGraph:
             tier2_enabled=self.__visual_tier2_enabled,
             tier2_fail_open=self.__visual_tier2_fail_open,
             equation_max_chars=self.__equation_max_chars,
+            repair_limiter=await self.__repair_limiter(),
             run_config=self.__thread_config,
         )
 
@@ -336,7 +374,7 @@ class ResearchGraph:
         return await run_generate_perspectives(
             state,
             emit_progress=self.__emit_progress,
-            gemini_model=self.__gemini_model,
+            perspectives_model=self.__perspectives_model,
             node_builder=self.__node,
             expert_count=self.__expert_count,
             run_config=self.__thread_config,
@@ -1,9 +1,10 @@
 """equation_repair.py — LLM repair loop for invalid equation spans.
 
-Mirrors ``visual_repair.py`` in structure: validates all spans, iterates over
-invalid spans back-to-front, attempts LLM repair up to *equation_repair_max_retries*
-times, and falls back to replacing the broken equation with an inline code span
-(`` `expression` ``) so the surrounding prose is preserved.
+Mirrors ``visual_repair.py`` in structure: validates all spans, repairs the
+invalid spans concurrently with up to *equation_repair_max_retries* attempts
+each, splices the results back-to-front, and falls back to replacing the
+broken equation with an inline code span (`` `expression` ``) so the
+surrounding prose is preserved.
 """
 
 from __future__ import annotations
@@ -135,11 +136,13 @@ async def repair_section_equations(
     tier2_enabled: bool,
     tier2_fail_open: bool,
     equation_max_chars: int = 4096,
+    repair_limiter: asyncio.Semaphore,
     run_config: dict[str, Any] | None = None,
 ) -> ContentSection:
     """Repair invalid equation spans inside *section*.
 
-    For each invalid span (processed back-to-front to preserve offsets):
+    Invalid spans are repaired concurrently, at most as many at once as
+    *repair_limiter* allows, and spliced back-to-front to preserve offsets. For each span:
 
     * Attempt LLM repair up to *equation_repair_max_retries* times.
     * If a valid repair is produced, splice it back via :func:`_replace_span`.
@@ -172,18 +175,8 @@ async def repair_section_equations(
 
     repair_attempt_budget = max(0, int(equation_repair_max_retries))
 
-    # Process invalid spans back-to-front so that earlier offsets are
-    # unaffected by replacements at later positions.
-    invalid_desc = sorted(
-        initial_report.invalid_spans,
-        key=lambda item: item.span.start,
-        reverse=True,
-    )
-
-    for invalid in invalid_desc:
+    async def _repair_span_attempts(invalid: InvalidEquationSpan) -> str:
         original_span = invalid.span
-        repaired = False
-
         if repair_attempt_budget > 0 and not _prefer_plaintext_fallback(original_span, invalid.reason):
             for attempt in range(1, repair_attempt_budget + 1):
                 repair_prompt = node_builder.repair_equation_prompt(
@@ -218,18 +211,10 @@ async def repair_section_equations(
                     if not candidate_result.is_valid:
                         continue
 
-                    candidate_replacement = _build_delimited_equation(
+                    return _build_delimited_equation(
                         original_span.delimiter_style,
                         candidate_text,
                     )
-                    working_content = _replace_span(
-                        working_content,
-                        original_span.start,
-                        original_span.end,
-                        candidate_replacement,
-                    )
-                    repaired = True
-                    break
 
                 except asyncio.CancelledError:
                     raise
@@ -240,15 +225,31 @@ async def repair_section_equations(
                         f"({original_span.delimiter_style}): {error}"
                     )
 
-        if not repaired:
-            # Preserve prose-like false positives as text, and downgrade real
-            # broken equations to inline code.
-            working_content = _replace_span(
-                working_content,
-                original_span.start,
-                original_span.end,
-                _fallback_replacement(original_span, invalid.reason),
-            )
+        # Preserve prose-like false positives as text, and downgrade real
+        # broken equations to inline code.
+        return _fallback_replacement(original_span, invalid.reason)
+
+    async def _repair_span(invalid: InvalidEquationSpan) -> str:
+        async with repair_limiter:
+            return await _repair_span_attempts(invalid)
+
+    # Spans are repaired concurrently, then spliced back-to-front so that
+    # earlier offsets are unaffected by replacements at later positions.
+    invalid_desc = sorted(
+        initial_report.invalid_spans,
+        key=lambda item: item.span.start,
+        reverse=True,
+    )
+    replacements = await asyncio.gather(
+        *(_repair_span(invalid) for invalid in invalid_desc)
+    )
+    for invalid, replacement in zip(invalid_desc, replacements):
+        working_content = _replace_span(
+            working_content,
+            invalid.span.start,
+            invalid.span.end,
+            replacement,
+        )
 
     final_report = await _validate_all_spans(
         working_content,
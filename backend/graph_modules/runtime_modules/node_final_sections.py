@@ -1,15 +1,25 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
+from dataclasses import dataclass
 from typing import Any
 
 from structures import CompleteDocument, ContentSection
 
 from ..helpers import fallback_section_text, message_text
+from .equation_repair import resolve_equation_repair_task
 from .errors import ResearchTerminalError
 from .section_generation import is_context_window_error
 
 
+@dataclass
+class _PendingRepair:
+    section_index: int
+    task: asyncio.Task[ContentSection]
+    summary_after: str | None
+
+
 async def compact_final_summary(
     *,
     summary_model: Any,
@@ -33,6 +43,43 @@ async def compact_final_summary(
     return next_summary or current_summary
 
 
+async def next_final_rolling_summary(
+    *,
+    summary_model: Any,
+    node_builder: Any,
+    sections: list[ContentSection],
+    summary: str | None,
+    section_title: str,
+    summary_timeout_seconds: float,
+    run_config: dict[str, Any] | None = None,
+) -> str | None:
+    try:
+        summary_message = await asyncio.wait_for(
+            summary_model.ainvoke(
+                node_builder.generate_rolling_summary(
+                    "\n".join([section_item.as_str for section_item in sections])
+                ),
+                config=run_config,
+            ),
+            timeout=float(summary_timeout_seconds),
+        )
+        next_summary = message_text(summary_message).strip()
+        return next_summary or summary
+    except asyncio.CancelledError:
+        raise
+    except asyncio.TimeoutError:
+        print(
+            f"[graph] Final rolling summary timed out after "
+            f"section '{section_title}'. Continuing with prior summary."
+        )
+    except Exception as summary_error:
+        print(
+            f"[graph] Final rolling summary failed after section "
+            f"'{section_title}': {summary_error}. Continuing with prior summary."
+        )
+    return summary
+
+
 async def run_final_section_generation(
     state: dict[str, Any],
     *,
@@ -54,15 +101,19 @@ async def run_final_section_generation(
         state.pop("final_section_progress", None)
         return {"final_document": build_low_breadth_document(state)}
 
+    document_outline = state["document_outline"]
     perspective_rows = list(state.get("perspective_content", []))
-    sections = list(state["document_outline"].sections)
-    saved_progress = state.get("final_section_progress") if isinstance(state.get("final_section_progress"), dict) else {}
+    sections = list(document_outline.sections)
+    saved_progress = state.get("final_section_progress")
+    if not isinstance(saved_progress, dict):
+        saved_progress = {}
     completed_sections = [
         section
         for section in list(saved_progress.get("completed_sections") or [])[: len(perspective_rows)]
         if isinstance(section, ContentSection)
     ]
     summary = str(saved_progress.get("summary") or "").strip() or None
+    outline_str = document_outline.as_str
 
     if len(completed_sections) > 0:
         await emit_progress(
@@ -73,108 +124,135 @@ async def run_final_section_generation(
             ),
         )
 
-    for section_index in range(len(completed_sections), len(perspective_rows)):
-        section = sections[section_index]
-        section_title = str(getattr(section, "section_title", f"Section {section_index + 1}") or f"Section {section_index + 1}")
-        section_content = [
-            str(item or "").strip() for item in perspective_rows[section_index] if str(item or "").strip()
-        ]
-        if len(section_content) == 0:
-            section_content = [fallback_section_text(section_title)]
-
-        final_section: ContentSection | None = None
-        for attempt in range(3):
-            attempt_label = "initial attempt" if attempt == 0 else f"retry {attempt}/2"
+    # Repairs only touch the section they were started for, so section N's
+    # repairs keep running while section N + 1 is generated. Finished sections
+    # are committed and checkpointed strictly in outline order.
+    pending_repairs: deque[_PendingRepair] = deque()
+    drafted_sections = list(completed_sections)
+
+    async def _commit_repaired_sections(*, wait: bool) -> None:
+        nonlocal completed_sections
+        while pending_repairs and (wait or pending_repairs[0].task.done()):
+            pending = pending_repairs.popleft()
+            final_section = await pending.task
+            completed_sections = [*completed_sections, final_section]
+            drafted_sections[pending.section_index] = final_section
+            state["final_section_progress"] = {
+                "summary": pending.summary_after or "",
+                "completed_sections": list(completed_sections),
+            }
             await emit_progress(
                 "final_section_generation",
-                f"Generating final section {section_index + 1}/{len(perspective_rows)} ({attempt_label}).",
+                f"Completed final section {pending.section_index + 1}/{len(perspective_rows)}.",
             )
-            try:
-                generated_section = await generate_final_section(
-                    section_content=section_content,
-                    outline_str=state["document_outline"].as_str,
-                    summary=summary,
-                )
-                viz_repaired = await resolve_repair_task(
-                    asyncio.create_task(repair_section_visualizations(generated_section)),
-                    generated_section,
-                )
-                final_section = await repair_section_equations(
-                    viz_repaired
-                )
+            await emit_state_checkpoint(state, "final_section_generation")
 
-                next_sections = [*completed_sections, final_section]
+    async def _repair_final_section(generated_section: ContentSection) -> ContentSection:
+        viz_repaired = await resolve_repair_task(
+            asyncio.create_task(repair_section_visualizations(generated_section)),
+            generated_section,
+        )
+        return await resolve_equation_repair_task(
+            asyncio.create_task(repair_section_equations(viz_repaired)),
+            viz_repaired,
+        )
+
+    try:
+        for section_index in range(len(completed_sections), len(perspective_rows)):
+            section = sections[section_index]
+            section_title = str(getattr(section, "section_title", f"Section {section_index + 1}") or f"Section {section_index + 1}")
+            section_content = [
+                str(item or "").strip() for item in perspective_rows[section_index] if str(item or "").strip()
+            ]
+            if len(section_content) == 0:
+                section_content = [fallback_section_text(section_title)]
+
+            generated_section: ContentSection | None = None
+            for attempt in range(3):
+                attempt_label = "initial attempt" if attempt == 0 else f"retry {attempt}/2"
+                await emit_progress(
+                    "final_section_generation",
+                    f"Generating final section {section_index + 1}/{len(perspective_rows)} ({attempt_label}).",
+                )
                 try:
-                    summary_message = await asyncio.wait_for(
-                        summary_model.ainvoke(
-                            node_builder.generate_rolling_summary(
-                                "\n".join([section_item.as_str for section_item in next_sections])
-                            ),
-                            config=run_config,
-                        ),
-                        timeout=float(summary_timeout_seconds),
+                    generated_section = await generate_final_section(
+                        section_content=section_content,
+                        outline_str=outline_str,
+                        summary=summary,
                     )
-                    next_summary = message_text(summary_message).strip()
-                    summary = next_summary or summary
+                    break
                 except asyncio.CancelledError:
                     raise
-                except asyncio.TimeoutError:
-                    print(
-                        f"[graph] Final rolling summary timed out after "
-                        f"section '{section_title}'. Continuing with prior summary."
-                    )
-                except Exception as summary_error:
+                except Exception as error:
+                    if attempt >= 2:
+                        raise ResearchTerminalError(
+                            "Final section generation failed after 1 initial attempt and 2 retries "
+                            f"for '{section_title}': {error}"
+                        ) from error
+                    if is_context_window_error(error):
+                        try:
+                            summary = await compact_final_summary(
+                                summary_model=summary_model,
+                                node_builder=node_builder,
+                                summary=summary,
+                                summary_timeout_seconds=summary_timeout_seconds,
+                                run_config=run_config,
+                            )
+                        except asyncio.CancelledError:
+                            raise
+                        except Exception as summary_error:
+                            print(
+                                f"[graph] Final-section summary compaction failed for '{section_title}': "
+                                f"{summary_error}"
+                            )
                     print(
-                        f"[graph] Final rolling summary failed after section "
-                        f"'{section_title}': {summary_error}. Continuing with prior summary."
+                        f"[graph] Final section {section_index + 1}/{len(perspective_rows)} "
+                        f"attempt {attempt + 1}/3 failed for '{section_title}': {error}"
                     )
-                completed_sections = next_sections
-                state["final_section_progress"] = {
-                    "summary": summary or "",
-                    "completed_sections": list(completed_sections),
-                }
-                await emit_progress(
-                    "final_section_generation",
-                    f"Completed final section {section_index + 1}/{len(perspective_rows)}.",
-                )
-                await emit_state_checkpoint(state, "final_section_generation")
-                break
-            except asyncio.CancelledError:
-                raise
-            except Exception as error:
-                if attempt >= 2:
-                    raise ResearchTerminalError(
-                        "Final section generation failed after 1 initial attempt and 2 retries "
-                        f"for '{section_title}': {error}"
-                    ) from error
-                if is_context_window_error(error):
-                    try:
-                        summary = await compact_final_summary(
-                        summary_model=summary_model,
-                        node_builder=node_builder,
-                        summary=summary,
-                        summary_timeout_seconds=summary_timeout_seconds,
-                        run_config=run_config,
-                    )
-                    except asyncio.CancelledError:
-                        raise
-                    except Exception as summary_error:
-                        print(
-                            f"[graph] Final-section summary compaction failed for '{section_title}': "
-                            f"{summary_error}"
-                        )
-                print(
-                    f"[graph] Final section {section_index + 1}/{len(perspective_rows)} "
-                    f"attempt {attempt + 1}/3 failed for '{section_title}': {error}"
+            if generated_section is None:
+                raise ResearchTerminalError(
+                    f"Final section generation did not produce a section for '{section_title}'."
                 )
-        if final_section is None:
-            raise ResearchTerminalError(
-                f"Final section generation did not produce a section for '{section_title}'."
+
+            drafted_sections.append(generated_section)
+            # Queued before the summary call so a failure while it runs still
+            # checkpoints this section; until then it carries the prior summary.
+            pending = _PendingRepair(
+                section_index=section_index,
+                task=asyncio.create_task(_repair_final_section(generated_section)),
+                summary_after=summary,
+            )
+            pending_repairs.append(pending)
+            summary = await next_final_rolling_summary(
+                summary_model=summary_model,
+                node_builder=node_builder,
+                sections=drafted_sections,
+                summary=summary,
+                section_title=section_title,
+                summary_timeout_seconds=summary_timeout_seconds,
+                run_config=run_config,
+            )
+            pending.summary_after = summary
+            await _commit_repaired_sections(wait=False)
+
+        await _commit_repaired_sections(wait=True)
+    finally:
+        if pending_repairs:
+            # Keep the repairs that already finished before dropping the rest.
+            try:
+                await _commit_repaired_sections(wait=False)
+            except Exception as commit_error:
+                print(f"[graph] Could not checkpoint finished final sections: {commit_error}")
+            for pending in pending_repairs:
+                pending.task.cancel()
+            await asyncio.gather(
+                *(pending.task for pending in pending_repairs),
+                return_exceptions=True,
             )
 
     state.pop("final_section_progress", None)
     final_document = CompleteDocument(
-        title=state["document_outline"].document_title,
+        title=document_outline.document_title,
         sections=completed_sections,
     )
     return {"final_document": final_document}
@@ -474,7 +474,8 @@ async def run_generate_content_for_perspectives(
     expert_context_summary_trim_tokens_to_summarize: int,
 ) -> dict[str, Any]:
     await emit_progress("generate_content_for_perspectives")
-    sections = list(state["document_outline"].sections)
+    document_outline = state["document_outline"]
+    sections = list(document_outline.sections)
     if len(sections) == 0:
         state.pop("expert_progress", None)
         return {"perspective_content": []}
@@ -490,9 +491,10 @@ async def run_generate_content_for_perspectives(
         state.pop("expert_progress", None)
         return {"perspective_content": existing_perspective_content}
 
+    expert_progress = state.get("expert_progress")
     saved_expert_progress = (
-        state.get("expert_progress", {}).get("experts", {})
-        if isinstance(state.get("expert_progress"), dict)
+        expert_progress.get("experts", {})
+        if isinstance(expert_progress, dict)
         else {}
     )
     experts = list(state["perspectives"].experts)
@@ -539,9 +541,10 @@ async def run_generate_content_for_perspectives(
         )
         progress_flusher.start()
     expert_agents: list[tuple[int, str, object]] = []
+    outline_str = document_outline.as_str
     for index, expert_name, expert in expert_specs:
         model = gpt_model if index % 2 == 0 else gemini_model
-        system_prompt = node_builder.perspective_agent(expert, state["document_outline"].as_str)
+        system_prompt = node_builder.perspective_agent(expert, outline_str)
         middleware = []
         if expert_context_summarization_enabled:
             middleware = [
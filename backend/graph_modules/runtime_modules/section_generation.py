@@ -353,38 +353,55 @@ async def generate_section_with_retry_policy(
             }
         )
 
+    async def _compact_thread(attempt_config: dict[str, Any], *, force: bool) -> bool:
+        return await compact_agent_thread_history(
+            agent=agent,
+            summary_model=summary_model,
+            thread_config=attempt_config,
+            trigger_tokens=section_context_trigger_tokens,
+            keep_last_messages=section_context_keep_messages,
+            trim_tokens_to_summarize=section_context_trim_tokens_to_summarize,
+            summary_config=run_config,
+            force=force,
+            timeout_seconds=summary_timeout_seconds,
+        )
+
+    async def _attempt_section(
+        attempt_config: dict[str, Any],
+        *,
+        append_prompt: bool,
+        status: str,
+        status_label: str,
+    ) -> str:
+        if await _compact_thread(attempt_config, force=False):
+            await _emit_status(status, status_label)
+        result = await asyncio.wait_for(
+            invoke_section_agent(
+                agent=agent,
+                prompt=prompt,
+                append_prompt=append_prompt,
+                run_config=attempt_config,
+            ),
+            timeout=section_attempt_timeout_seconds,
+        )
+        content_text = extract_agent_text_content(result).strip()
+        if content_text:
+            return content_text
+        raise ValueError("Generated section content was empty.")
+
     for warm_attempt in range(warm_retry_budget + 1):
         if warm_attempt == 0:
             await _emit_status("writing", "Writing")
         else:
             await _emit_status("warm_retry", f"Warm Retry {warm_attempt}/{warm_retry_budget}")
         try:
-            proactively_compacted = await compact_agent_thread_history(
-                agent=agent,
-                summary_model=summary_model,
-                thread_config=thread_config,
-                trigger_tokens=section_context_trigger_tokens,
-                keep_last_messages=section_context_keep_messages,
-                trim_tokens_to_summarize=section_context_trim_tokens_to_summarize,
-                summary_config=run_config,
-                force=False,
-                timeout_seconds=summary_timeout_seconds,
-            )
-            if proactively_compacted:
-                await _emit_status("writing", "Writing")
-            result = await asyncio.wait_for(
-                invoke_section_agent(
-                    agent=agent,
-                    prompt=prompt,
-                    append_prompt=(warm_attempt == 0),
-                    run_config=thread_config,
-                ),
-                timeout=section_attempt_timeout_seconds,
+            content_text = await _attempt_section(
+                thread_config,
+                append_prompt=(warm_attempt == 0),
+                status="writing",
+                status_label="Writing",
             )
-            content_text = extract_agent_text_content(result).strip()
-            if content_text:
-                return content_text, "completed"
-            raise ValueError("Generated section content was empty.")
+            return content_text, "completed"
         except asyncio.CancelledError:
             raise
         except Exception as error:
@@ -405,17 +422,7 @@ async def generate_section_with_retry_policy(
 
             if is_context_window_error(error):
                 await _emit_status("compacting", "Compacting Context")
-                compacted = await compact_agent_thread_history(
-                    agent=agent,
-                    summary_model=summary_model,
-                    thread_config=thread_config,
-                    trigger_tokens=section_context_trigger_tokens,
-                    keep_last_messages=section_context_keep_messages,
-                    trim_tokens_to_summarize=section_context_trim_tokens_to_summarize,
-                    summary_config=run_config,
-                    force=True,
-                    timeout_seconds=summary_timeout_seconds,
-                )
+                compacted = await _compact_thread(thread_config, force=True)
                 if not compacted:
                     try:
                         cleaned_messages = get_agent_thread_messages(
@@ -451,27 +458,13 @@ async def generate_section_with_retry_policy(
         thread_config = build_agent_run_config(run_config, thread_id)
         await _emit_status("cold_retry", f"Cold Retry {cold_retry}/{cold_retry_budget}")
         try:
-            proactively_compacted = await compact_agent_thread_history(
-                agent=agent,
-                summary_model=summary_model,
-                thread_config=thread_config,
-                trigger_tokens=section_context_trigger_tokens,
-                keep_last_messages=section_context_keep_messages,
-                trim_tokens_to_summarize=section_context_trim_tokens_to_summarize,
-                summary_config=run_config,
-                force=False,
-                timeout_seconds=summary_timeout_seconds,
-            )
-            if proactively_compacted:
-                await _emit_status("cold_retry", f"Cold Retry {cold_retry}/{cold_retry_budget}")
-            result = await asyncio.wait_for(
-                invoke_section_agent(agent=agent, prompt=prompt, run_config=thread_config),
-                timeout=section_attempt_timeout_seconds,
+            content_text = await _attempt_section(
+                thread_config,
+                append_prompt=True,
+                status="cold_retry",
+                status_label=f"Cold Retry {cold_retry}/{cold_retry_budget}",
             )
-            content_text = extract_agent_text_content(result).strip()
-            if content_text:
-                return content_text, "completed"
-            raise ValueError("Generated section content was empty.")
+            return content_text, "completed"
         except asyncio.CancelledError:
             raise
         except Exception as error:
@@ -627,7 +620,7 @@ async def generate_final_section(
     outline_str: str,
     summary: str | None,
     node_builder: Any,
-    final_content_model: Any,
+    final_section_model: Any,
     run_config: dict[str, Any] | None = None,
 ) -> ContentSection:
     messages = node_builder.generate_combined_section(
@@ -637,22 +630,17 @@ async def generate_final_section(
     )
 
     try:
-        return await final_content_model.with_structured_output(ContentSection).ainvoke(
-            messages,
-            config=run_config,
-        )
+        return await final_section_model.ainvoke(messages, config=run_config)
     except Exception as error:
         if not is_structured_output_error(error):
             raise
 
-    return await final_content_model.with_structured_output(ContentSection).ainvoke(
-        messages,
-        config=run_config,
-    )
+    return await final_section_model.ainvoke(messages, config=run_config)
 
 
 def build_low_breadth_document(state: dict[str, Any]) -> CompleteDocument:
-    sections = list(state["document_outline"].sections)
+    document_outline = state["document_outline"]
+    sections = list(document_outline.sections)
     perspective_rows = list(state.get("perspective_content", []))
     final_sections: list[ContentSection] = []
 
@@ -676,6 +664,6 @@ def build_low_breadth_document(state: dict[str, Any]) -> CompleteDocument:
         )
 
     return CompleteDocument(
-        title=state["document_outline"].document_title,
+        title=document_outline.document_title,
         sections=final_sections,
     )
@@ -136,6 +136,7 @@ async def repair_section_visualizations(
     tier2_validator: Any,
     tier2_enabled: bool,
     tier2_fail_open: bool,
+    repair_limiter: asyncio.Semaphore,
     run_config: dict[str, Any] | None = None,
 ) -> ContentSection:
     if not visual_repair_enabled:
@@ -163,68 +164,69 @@ async def repair_section_visualizations(
         )
 
     repair_attempt_budget = max(0, int(visual_repair_max_retries))
-    invalid_blocks_desc = sorted(
-        initial_report.invalid_blocks,
-        key=lambda item: item.block.start,
-        reverse=True,
-    )
 
-    for invalid in invalid_blocks_desc:
+    async def _repair_block_attempts(invalid: InvalidVisualBlock) -> str | None:
         original_block = invalid.block
-        repaired = False
+        for attempt in range(1, repair_attempt_budget + 1):
+            repair_prompt = node_builder.repair_visual_block_prompt(
+                block_type=original_block.block_type,
+                block_content=original_block.content,
+                invalid_reason=invalid.reason,
+            )
+            try:
+                repaired_message = await asyncio.wait_for(
+                    model.ainvoke(repair_prompt, config=run_config),
+                    timeout=visual_repair_retry_timeout_seconds,
+                )
+                candidate_text = message_text(repaired_message)
+                candidate_body = _extract_repaired_body(
+                    candidate_text,
+                    original_block.block_type,
+                )
+                if not candidate_body:
+                    continue
 
-        if repair_attempt_budget > 0:
-            for attempt in range(1, repair_attempt_budget + 1):
-                repair_prompt = node_builder.repair_visual_block_prompt(
+                candidate_validation = await _validate_block_async(
                     block_type=original_block.block_type,
-                    block_content=original_block.content,
-                    invalid_reason=invalid.reason,
+                    block_body=candidate_body,
+                    tier2_validator=tier2_validator,
+                    tier2_enabled=tier2_enabled,
+                    tier2_fail_open=tier2_fail_open,
                 )
-                try:
-                    repaired_message = await asyncio.wait_for(
-                        model.ainvoke(repair_prompt, config=run_config),
-                        timeout=visual_repair_retry_timeout_seconds,
-                    )
-                    candidate_text = message_text(repaired_message)
-                    candidate_body = _extract_repaired_body(
-                        candidate_text,
-                        original_block.block_type,
-                    )
-                    if not candidate_body:
-                        continue
-
-                    candidate_validation = await _validate_block_async(
-                        block_type=original_block.block_type,
-                        block_body=candidate_body,
-                        tier2_validator=tier2_validator,
-                        tier2_enabled=tier2_enabled,
-                        tier2_fail_open=tier2_fail_open,
-                    )
-                    if not candidate_validation.is_valid:
-                        continue
-
-                    working_content = _replace_span(
-                        working_content,
-                        original_block.start,
-                        original_block.end,
-                        _build_fenced_block(original_block.block_type, candidate_body),
-                    )
-                    repaired = True
-                    break
-                except asyncio.CancelledError:
-                    raise
-                except Exception as error:
-                    print(
-                        f"[graph] Visualization block repair attempt {attempt}/{repair_attempt_budget} "
-                        f"failed for section '{section_title}' ({original_block.block_type}): {error}"
-                    )
-
-        if not repaired:
-            working_content = _remove_span(
-                working_content,
-                original_block.start,
-                original_block.end,
-            )
+                if not candidate_validation.is_valid:
+                    continue
+
+                return _build_fenced_block(original_block.block_type, candidate_body)
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                print(
+                    f"[graph] Visualization block repair attempt {attempt}/{repair_attempt_budget} "
+                    f"failed for section '{section_title}' ({original_block.block_type}): {error}"
+                )
+        return None
+
+    async def _repair_block(invalid: InvalidVisualBlock) -> str | None:
+        async with repair_limiter:
+            return await _repair_block_attempts(invalid)
+
+    # Blocks are repaired independently, so they run concurrently and are
+    # spliced back-to-front to keep the earlier offsets valid.
+    invalid_blocks_desc = sorted(
+        initial_report.invalid_blocks,
+        key=lambda item: item.block.start,
+        reverse=True,
+    )
+    replacements = await asyncio.gather(
+        *(_repair_block(invalid) for invalid in invalid_blocks_desc)
+    )
+    for invalid, replacement in zip(invalid_blocks_desc, replacements):
+        working_content = _replace_span(
+            working_content,
+            invalid.block.start,
+            invalid.block.end,
+            replacement or "",
+        )
 
     final_report = await validate_section_visualizations(
         working_content,
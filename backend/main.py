@@ -13,12 +13,14 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 
 from api.routes.auth import router as auth_router
 from api.routes.chat import router as chat_router
+from api.routes.chat_modules.common import AutoResearchDecision
 from api.routes.feedback import router as feedback_router
 from api.routes.system import router as system_router
 from auth_service import FirebaseAuthService
 from browser_lifecycle import BrowserLifecycleManager, ManagedBrowser
 from custom_search import CustomSearch
 from database import Database
+from graph import ResearchGraph
 from graph_modules.visual_tier2 import PlaywrightVisualTier2Validator
 from pdf_processing import PdfBackgroundWorker, PdfProcessingService
 from research_worker import ResearchBackgroundWorker
@@ -55,6 +57,7 @@ async def lifespan(app: FastAPI):
     app.state.browser = ManagedBrowser(app.state.browser_manager)
     app.state.custom_search = CustomSearch()
     app.state.database = Database()
+    app.state.database_warmup_task = asyncio.create_task(app.state.database.warm_up())
     app.state.pdf_background_worker = PdfBackgroundWorker(app.state.database)
     app.state.pdf_worker_task = asyncio.create_task(
         app.state.pdf_background_worker.run_forever()
@@ -73,6 +76,10 @@ async def lifespan(app: FastAPI):
     app.state.chat_model_mini = ChatGoogleGenerativeAI(
         model="models/gemini-flash-latest"
     )
+    app.state.auto_research_decision_model = app.state.chat_model_mini.with_structured_output(
+        AutoResearchDecision,
+        method="json_schema",
+    )
     app.state.firebase_auth = FirebaseAuthService()
 
     app.state.frontend_base_url = settings.frontend_base_url or app.state.firebase_auth.frontend_base_url
@@ -83,6 +90,10 @@ async def lifespan(app: FastAPI):
     app.state.cookie_domain = settings.cookie_domain
     app.state.cookie_samesite = settings.cookie_samesite
     yield
+    database_warmup_task = getattr(app.state, "database_warmup_task", None)
+    if database_warmup_task is not None:
+        database_warmup_task.cancel()
+        await asyncio.gather(database_warmup_task, return_exceptions=True)
     pdf_worker_task = getattr(app.state, "pdf_worker_task", None)
     if pdf_worker_task is not None:
         pdf_worker_task.cancel()
@@ -96,8 +107,12 @@ async def lifespan(app: FastAPI):
     if browser_manager is not None:
         await browser_manager.stop()
     await PlaywrightVisualTier2Validator.clear_session_limiters()
+    await ResearchGraph.clear_repair_limiters()
     await PdfProcessingService.aclose_shared_client()
     await CustomSearch.aclose()
+    firebase_auth = getattr(app.state, "firebase_auth", None)
+    if firebase_auth is not None:
+        await firebase_auth.aclose()
     app.state.database.close_connection()
 
 
@@ -5,13 +5,13 @@ from typing import Any, ClassVar
 import httpx
 from langchain_core.documents import Document
 from langchain_core.messages import HumanMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
 
 from database import Database
 from nodes import Nodes
 from pdf_processing_modules.helpers import extract_pdf_text_from_bytes
 from pdf_processing_modules.models import PdfProcessResult
 from settings import build_langsmith_thread_config, get_settings
+from shared_models import get_summary_model
 
 
 class PdfProcessingService:
@@ -32,11 +32,7 @@ class PdfProcessingService:
         self._primary_timeout_seconds = settings.pdf_primary_timeout_seconds
         self._fallback_timeout_seconds = settings.pdf_in_memory_timeout_seconds
         self._min_partial_chars = settings.pdf_min_partial_chars
-        self._primary_model = (
-            ChatGoogleGenerativeAI(model="models/gemini-flash-lite-latest")
-            if enable_primary_model
-            else None
-        )
+        self._primary_model = get_summary_model() if enable_primary_model else None
         self._nodes = Nodes()
 
     @classmethod
@@ -126,16 +122,24 @@ class PdfProcessingService:
         return ""
 
     @staticmethod
-    def _merge_chunk_text(existing: str, incoming: str) -> str:
+    def _merge_chunk_text(parts: list[str], length: int, incoming: str) -> int:
+        # Chunks are normally deltas; only cumulative or repeated chunks look past the tail.
         if not incoming:
-            return existing
-        if not existing:
-            return incoming
-        if incoming.startswith(existing):
-            return incoming
-        if existing.endswith(incoming):
-            return existing
-        return f"{existing}{incoming}"
+            return length
+        if len(incoming) >= length and incoming.startswith("".join(parts)):
+            parts[:] = [incoming]
+            return len(incoming)
+
+        tail = ""
+        for part in reversed(parts):
+            tail = part + tail
+            if len(tail) >= len(incoming):
+                break
+        if tail.endswith(incoming):
+            return length
+
+        parts.append(incoming)
+        return length + len(incoming)
 
     async def extract_with_gemini_stream(
         self,
@@ -156,7 +160,8 @@ class PdfProcessingService:
         resolved_title = self._derive_title(url, title)
         prompt = self._nodes.pdf_url_extraction_prompt(url)
 
-        accumulated = ""
+        accumulated_parts: list[str] = []
+        accumulated_length = 0
         timed_out = False
         stream = self._primary_model.astream(
             [HumanMessage(content=prompt)],
@@ -183,13 +188,17 @@ class PdfProcessingService:
                     timed_out = True
                     break
 
-                accumulated = self._merge_chunk_text(accumulated, self._chunk_text(chunk))
+                accumulated_length = self._merge_chunk_text(
+                    accumulated_parts,
+                    accumulated_length,
+                    self._chunk_text(chunk),
+                )
         except asyncio.CancelledError:
             raise
         except Exception as error:
             return PdfProcessResult(
                 status="failed",
-                text=accumulated.strip(),
+                text="".join(accumulated_parts).strip(),
                 title=resolved_title,
                 source=url,
                 error=str(error),
@@ -202,7 +211,7 @@ class PdfProcessingService:
                 except Exception:
                     pass
 
-        normalized_text = accumulated.strip()
+        normalized_text = "".join(accumulated_parts).strip()
         if timed_out:
             if normalized_text and len(normalized_text) >= self._min_partial_chars:
                 return PdfProcessResult(
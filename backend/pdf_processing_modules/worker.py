@@ -104,8 +104,13 @@ class PdfBackgroundWorker:
                     await asyncio.sleep(self._poll_interval_seconds)
                     continue
 
-                for job in jobs:
-                    await self._process_job(job)
+                results = await asyncio.gather(
+                    *(self._process_job(job) for job in jobs),
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        print(f"[pdf-worker] Job error: {result}")
             except asyncio.CancelledError:
                 raise
             except Exception as error:
@@ -1,11 +1,13 @@
 import asyncio
 import inspect
 import logging
-from dataclasses import dataclass
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
-from bs4 import BeautifulSoup
 from langchain_core.documents import Document
+from lxml import etree, html as lxml_html
 from playwright.async_api import BrowserContext, Page, TimeoutError as PlaywrightTimeoutError
 from playwright_stealth import Stealth
 from settings import get_settings
@@ -16,6 +18,11 @@ if TYPE_CHECKING:
 
 SCRAPE_TIMEOUT_MS = get_settings().scrape_timeout_ms
 logger = logging.getLogger(__name__)
+# Same strings BeautifulSoup's get_text yields: all text nodes, head included,
+# minus script, style and template contents (comments are not text nodes).
+_DOCUMENT_TEXT_XPATH = etree.XPath(
+    "//text()[not(ancestor::script) and not(ancestor::style) and not(ancestor::template)]"
+)
 
 
 @dataclass
@@ -26,35 +33,118 @@ class _ContextSlot:
     retired: bool = False
 
 
+@dataclass
+class _ContextPool:
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    slots: dict[int, _ContextSlot] = field(default_factory=dict)
+    active_slot_id: int | None = None
+    next_slot_id: int = 1
+
+
+# Scrape instances are created per research run and chat turn. Pools are kept
+# per browser and session so a session reuses its context across them, while
+# cookies and storage never cross sessions. The least recently used session
+# pools are closed once SCRAPE_MAX_SESSION_CONTEXTS is exceeded.
+_CONTEXT_POOLS: "weakref.WeakKeyDictionary[Any, OrderedDict[str, _ContextPool]]" = weakref.WeakKeyDictionary()
+_POOL_CLOSE_TASKS: set[asyncio.Task[None]] = set()
+
+
+def _context_pool_for(browser: Any, session_id: str) -> _ContextPool | None:
+    try:
+        pools = _CONTEXT_POOLS.get(browser)
+        if pools is None:
+            pools = OrderedDict()
+            _CONTEXT_POOLS[browser] = pools
+    except TypeError:
+        return None
+
+    pool = pools.get(session_id)
+    if pool is not None:
+        pools.move_to_end(session_id)
+        return pool
+
+    pool = _ContextPool()
+    pools[session_id] = pool
+    while len(pools) > get_settings().scrape_max_session_contexts:
+        _, evicted = pools.popitem(last=False)
+        _schedule_pool_close(evicted)
+    return pool
+
+
+def _schedule_pool_close(pool: _ContextPool) -> None:
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    task = loop.create_task(_close_pool(pool))
+    _POOL_CLOSE_TASKS.add(task)
+    task.add_done_callback(_POOL_CLOSE_TASKS.discard)
+
+
+async def _close_pool(pool: _ContextPool) -> None:
+    # Idle contexts close now; in-flight ones close when their last page is released.
+    idle_contexts: list[BrowserContext] = []
+    async with pool.lock:
+        pool.active_slot_id = None
+        for slot_id, slot in list(pool.slots.items()):
+            slot.retired = True
+            if slot.ref_count == 0:
+                pool.slots.pop(slot_id, None)
+                idle_contexts.append(slot.context)
+
+    for context in idle_contexts:
+        try:
+            await context.close()
+        except Exception:
+            pass
+
+
 def _extract_text_and_title(
     html: str,
     url: str,
     provided_title: str | None,
     page_title: str | None,
 ) -> tuple[str, str]:
-    soup = BeautifulSoup(html, "lxml")
-    text = soup.get_text(separator="\n", strip=True)
-
-    resolved_title = (
-        provided_title
-        or page_title
-        or (soup.title.string.strip() if soup.title and soup.title.string else None)
-        or url
+    try:
+        # lxml rejects str input that carries an XML encoding declaration.
+        tree = lxml_html.document_fromstring(
+            html.encode("utf-8"),
+            parser=lxml_html.HTMLParser(encoding="utf-8"),
+        )
+    except (etree.ParserError, ValueError):
+        return provided_title or page_title or url, ""
+
+    text = "\n".join(
+        stripped for stripped in (str(node).strip() for node in _DOCUMENT_TEXT_XPATH(tree)) if stripped
     )
+    document_title = (tree.findtext(".//title") or "").strip()
+
+    resolved_title = provided_title or page_title or document_title or url
 
     return resolved_title, text
 
 
 class Scrape:
-    def __init__(self, browser: Any, pdf_processor: "PdfProcessingService | None" = None):
+    def __init__(
+        self,
+        browser: Any,
+        session_id: str,
+        pdf_processor: "PdfProcessingService | None" = None,
+    ):
         self.browser = browser
+        self._session_id = session_id
         self._stealth = Stealth()
-        self._slot_lock = asyncio.Lock()
-        self._slots: dict[int, _ContextSlot] = {}
-        self._active_slot_id: int | None = None
-        self._next_slot_id = 1
+        self._own_pool: _ContextPool | None = None
         self._pdf_processor = pdf_processor
 
+    def _session_pool(self) -> _ContextPool:
+        pool = _context_pool_for(self.browser, self._session_id)
+        if pool is not None:
+            return pool
+        if self._own_pool is None:
+            self._own_pool = _ContextPool()
+        return self._own_pool
+
     @staticmethod
     def _is_browser_disconnect_error(message: str) -> bool:
         lowered = message.lower()
@@ -155,35 +245,35 @@ class Scrape:
                 raise
         raise RuntimeError("Failed to create scrape browser context.")
 
-    def _get_active_slot_unlocked(self) -> _ContextSlot | None:
-        if self._active_slot_id is None:
+    def _get_active_slot_unlocked(self, pool: _ContextPool) -> _ContextSlot | None:
+        if pool.active_slot_id is None:
             return None
-        slot = self._slots.get(self._active_slot_id)
+        slot = pool.slots.get(pool.active_slot_id)
         if slot is None or slot.retired:
-            self._active_slot_id = None
+            pool.active_slot_id = None
             return None
         return slot
 
-    async def _get_or_create_active_slot(self) -> _ContextSlot:
-        async with self._slot_lock:
-            slot = self._get_active_slot_unlocked()
+    async def _get_or_create_active_slot(self, pool: _ContextPool) -> _ContextSlot:
+        async with pool.lock:
+            slot = self._get_active_slot_unlocked(pool)
             if slot is not None:
                 return slot
 
         new_context = await self._create_context()
         close_new_context = False
 
-        async with self._slot_lock:
-            existing_slot = self._get_active_slot_unlocked()
+        async with pool.lock:
+            existing_slot = self._get_active_slot_unlocked(pool)
             if existing_slot is not None:
                 close_new_context = True
                 selected_slot = existing_slot
             else:
-                slot_id = self._next_slot_id
-                self._next_slot_id += 1
+                slot_id = pool.next_slot_id
+                pool.next_slot_id += 1
                 selected_slot = _ContextSlot(slot_id=slot_id, context=new_context)
-                self._slots[slot_id] = selected_slot
-                self._active_slot_id = slot_id
+                pool.slots[slot_id] = selected_slot
+                pool.active_slot_id = slot_id
 
         if close_new_context:
             try:
@@ -193,28 +283,28 @@ class Scrape:
 
         return selected_slot
 
-    async def _acquire_active_slot(self) -> _ContextSlot:
+    async def _acquire_active_slot(self, pool: _ContextPool) -> _ContextSlot:
         while True:
-            slot = await self._get_or_create_active_slot()
-            async with self._slot_lock:
-                current = self._slots.get(slot.slot_id)
+            slot = await self._get_or_create_active_slot(pool)
+            async with pool.lock:
+                current = pool.slots.get(slot.slot_id)
                 if current is None or current.retired:
                     continue
                 current.ref_count += 1
                 return current
 
-    async def _release_slot_reference(self, slot_id: int) -> None:
+    async def _release_slot_reference(self, pool: _ContextPool, slot_id: int) -> None:
         if slot_id <= 0:
             return
         context_to_close: BrowserContext | None = None
-        async with self._slot_lock:
-            slot = self._slots.get(slot_id)
+        async with pool.lock:
+            slot = pool.slots.get(slot_id)
             if slot is None:
                 return
             if slot.ref_count > 0:
                 slot.ref_count -= 1
             if slot.retired and slot.ref_count == 0:
-                self._slots.pop(slot_id, None)
+                pool.slots.pop(slot_id, None)
                 context_to_close = slot.context
 
         if context_to_close is not None:
@@ -223,17 +313,17 @@ class Scrape:
             except Exception:
                 pass
 
-    async def _retire_slot(self, slot_id: int, reason: str) -> None:
+    async def _retire_slot(self, pool: _ContextPool, slot_id: int, reason: str) -> None:
         if slot_id <= 0:
             return
         context_to_close: BrowserContext | None = None
-        async with self._slot_lock:
-            slot = self._slots.get(slot_id)
+        async with pool.lock:
+            slot = pool.slots.get(slot_id)
             if slot is None:
                 return
             slot.retired = True
-            if self._active_slot_id == slot_id:
-                self._active_slot_id = None
+            if pool.active_slot_id == slot_id:
+                pool.active_slot_id = None
             logger.warning(
                 "Retiring scrape context slot=%s reason=%s in_flight=%s",
                 slot_id,
@@ -241,7 +331,7 @@ class Scrape:
                 slot.ref_count,
             )
             if slot.ref_count == 0:
-                self._slots.pop(slot_id, None)
+                pool.slots.pop(slot_id, None)
                 context_to_close = slot.context
 
         if context_to_close is not None:
@@ -250,20 +340,21 @@ class Scrape:
             except Exception:
                 pass
 
-    async def _new_page(self) -> tuple[Page, int]:
+    async def _new_page(self) -> tuple[Page, _ContextPool, int]:
         last_error: Exception | None = None
         for attempt in range(2):
-            slot = await self._acquire_active_slot()
+            pool = self._session_pool()
+            slot = await self._acquire_active_slot(pool)
             try:
                 page = await slot.context.new_page()
-                return page, slot.slot_id
+                return page, pool, slot.slot_id
             except Exception as exc:
-                await self._release_slot_reference(slot.slot_id)
+                await self._release_slot_reference(pool, slot.slot_id)
                 message = str(exc)
                 if not self._is_context_closed_error(message):
                     raise
 
-                await self._retire_slot(slot.slot_id, reason="new_page_context_closed")
+                await self._retire_slot(pool, slot.slot_id, reason="new_page_context_closed")
                 if self._is_browser_disconnect_error(message):
                     await self._relaunch_browser("new_page_browser_disconnected")
 
@@ -304,9 +395,10 @@ class Scrape:
             last_error: Exception | None = None
             for attempt in range(2):
                 page: Page | None = None
+                pool: _ContextPool | None = None
                 slot_id = 0
                 try:
-                    page, slot_id = await self._new_page()
+                    page, pool, slot_id = await self._new_page()
                     await self._goto_page(page, url)
                     await page.wait_for_selector("body", timeout=SCRAPE_TIMEOUT_MS)
 
@@ -338,8 +430,9 @@ class Scrape:
                 except Exception as exc:
                     message = str(exc)
                     if attempt == 0 and self._is_context_closed_error(message):
-                        if slot_id > 0:
+                        if pool is not None and slot_id > 0:
                             await self._retire_slot(
+                                pool,
                                 slot_id,
                                 reason="scrape_context_closed_during_navigation",
                             )
@@ -355,8 +448,8 @@ class Scrape:
                                 await page.close()
                         except Exception:
                             pass
-                    if slot_id > 0:
-                        await self._release_slot_reference(slot_id)
+                    if pool is not None and slot_id > 0:
+                        await self._release_slot_reference(pool, slot_id)
 
             if last_error is not None:
                 raise last_error
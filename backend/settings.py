@@ -84,15 +84,29 @@ class Settings:
     search_engine_id: str | None
     custom_search_timeout_seconds: float
     custom_search_base_url: str
+    custom_search_max_concurrency: int
+    custom_search_max_retries: int
+    custom_search_cache_ttl_seconds: float
 
     google_project_id: str | None
     google_cloud_project: str | None
     google_cloud_location: str | None
     google_application_credentials: str | None
+    vector_embedding_model: str
+    vector_embedding_dimensions: int | None
     vector_split_chunk_size: int
     vector_split_chunk_overlap: int
+    vector_search_k: int
+    vector_search_fetch_k: int
+    vector_search_use_mmr: bool
+    vector_query_cache_enabled: bool
+    vector_query_cache_similarity_threshold: float
+    vector_query_cache_max_entries_per_session: int
+    vector_query_cache_max_sessions: int
+    vector_query_cache_ttl_seconds: float
 
     scrape_timeout_ms: int
+    scrape_max_session_contexts: int
     web_search_total_timeout_seconds: float
     web_search_scrape_timeout_seconds: float
     min_web_documents_low: int
@@ -115,6 +129,7 @@ class Settings:
     visual_repair_enabled: bool
     visual_repair_max_retries: int
     visual_repair_retry_timeout_seconds: float
+    visual_repair_concurrency_per_session: int
     visual_tier2_enabled: bool
     visual_tier2_timeout_seconds: float
     visual_tier2_fail_open: bool
@@ -171,13 +186,33 @@ def get_settings() -> Settings:
         custom_search_base_url=_env_str(
             "CUSTOM_SEARCH_BASE_URL", "https://www.googleapis.com/customsearch/v1"
         ),
+        custom_search_max_concurrency=max(1, _env_int("CUSTOM_SEARCH_MAX_CONCURRENCY", 8)),
+        custom_search_max_retries=max(0, _env_int("CUSTOM_SEARCH_MAX_RETRIES", 2)),
+        custom_search_cache_ttl_seconds=max(0.0, _env_float("CUSTOM_SEARCH_CACHE_TTL_SECONDS", 600.0)),
         google_project_id=(_env_str("GOOGLE_PROJECT_ID") or None),
         google_cloud_project=(_env_str("GOOGLE_CLOUD_PROJECT") or None),
         google_cloud_location=(_env_str("GOOGLE_CLOUD_LOCATION") or None),
         google_application_credentials=(_env_str("GOOGLE_APPLICATION_CREDENTIALS") or None),
+        vector_embedding_model=_env_str("VECTOR_EMBEDDING_MODEL", "text-embedding-005"),
+        vector_embedding_dimensions=(max(0, _env_int("VECTOR_EMBEDDING_DIMENSIONS", 0)) or None),
         vector_split_chunk_size=_env_int("VECTOR_SPLIT_CHUNK_SIZE", 6500),
         vector_split_chunk_overlap=_env_int("VECTOR_SPLIT_CHUNK_OVERLAP", 200),
+        vector_search_k=max(1, _env_int("VECTOR_SEARCH_K", 5)),
+        vector_search_fetch_k=max(1, _env_int("VECTOR_SEARCH_FETCH_K", 50)),
+        vector_search_use_mmr=_env_bool("VECTOR_SEARCH_USE_MMR", True),
+        vector_query_cache_enabled=_env_bool("VECTOR_QUERY_CACHE_ENABLED", True),
+        vector_query_cache_similarity_threshold=_env_float(
+            "VECTOR_QUERY_CACHE_SIMILARITY_THRESHOLD",
+            0.95,
+        ),
+        vector_query_cache_max_entries_per_session=_env_int(
+            "VECTOR_QUERY_CACHE_MAX_ENTRIES_PER_SESSION",
+            256,
+        ),
+        vector_query_cache_max_sessions=_env_int("VECTOR_QUERY_CACHE_MAX_SESSIONS", 512),
+        vector_query_cache_ttl_seconds=_env_float("VECTOR_QUERY_CACHE_TTL_SECONDS", 300.0),
         scrape_timeout_ms=_env_int("SCRAPE_TIMEOUT_MS", 20_000),
+        scrape_max_session_contexts=max(1, _env_int("SCRAPE_MAX_SESSION_CONTEXTS", 32)),
         web_search_total_timeout_seconds=_env_float("WEB_SEARCH_TOTAL_TIMEOUT_SECONDS", 40.0),
         web_search_scrape_timeout_seconds=_env_float("WEB_SEARCH_SCRAPE_TIMEOUT_SECONDS", 30.0),
         min_web_documents_low=_env_int("MIN_WEB_DOCUMENTS_LOW", 1),
@@ -234,6 +269,7 @@ def get_settings() -> Settings:
             "VISUAL_REPAIR_RETRY_TIMEOUT_SECONDS",
             120.0,
         ),
+        visual_repair_concurrency_per_session=_env_int("VISUAL_REPAIR_CONCURRENCY_PER_SESSION", 4),
         visual_tier2_enabled=_env_bool("VISUAL_TIER2_ENABLED", True),
         visual_tier2_timeout_seconds=_env_float("VISUAL_TIER2_TIMEOUT_SECONDS", 4.0),
         visual_tier2_fail_open=_env_bool("VISUAL_TIER2_FAIL_OPEN", True),
@@ -0,0 +1,9 @@
+from functools import lru_cache
+
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+
+@lru_cache(maxsize=1)
+def get_summary_model() -> ChatGoogleGenerativeAI:
+    # One client (and connection pool) for every summarisation and PDF extraction call.
+    return ChatGoogleGenerativeAI(model="models/gemini-flash-lite-latest")
@@ -1,18 +1,31 @@
-from typing import List, Optional, TypedDict, Annotated
-from pydantic import BaseModel, Field
+from collections.abc import Mapping
+from functools import cached_property
+from typing import Any, List, Optional, Self, TypedDict, Annotated
+from pydantic import BaseModel, ConfigDict, Field
 import operator
 from langchain.messages import AnyMessage
 
-class OutlineSubsection(BaseModel):
+class _RenderedModel(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            # The copy shares __dict__ contents, including the cached rendering of the old fields.
+            copied.__dict__.pop("as_str", None)
+        return copied
+
+
+class OutlineSubsection(_RenderedModel):
     subsection_title: str = Field(title="Title of the subsection")
     description: str = Field(title="Description of the content for the subsection")
 
-    @property
+    @cached_property
     def as_str(self) -> str:
         return f"### {self.subsection_title}\n\n{self.description}".strip()
 
 
-class OutlineSection(BaseModel):
+class OutlineSection(_RenderedModel):
     section_title: str = Field(title="Title of the section")
     description: str = Field(title="Description of the content for the section")
     subsections: Optional[List[OutlineSubsection]] = Field(
@@ -20,13 +33,13 @@ class OutlineSection(BaseModel):
         title="Titles and descriptions for each subsection of the Research Document.",
     )
 
-    @property
+    @cached_property
     def as_str(self) -> str:
         subsections = "\n\n".join(subsection.as_str for subsection in self.subsections) if self.subsections else ""
         return f"## {self.section_title}\n\n{self.description}\n\n{subsections}".strip()
 
 
-class Outline(BaseModel):
+class Outline(_RenderedModel):
     document_title: str = Field(title="Title of the Research Document")
     document_description: str = Field(title="Detailed description of the Research Document's focus and scope.")
     sections: List[OutlineSection] = Field(
@@ -34,12 +47,12 @@ class Outline(BaseModel):
         title="Titles and descriptions for each section of the Research Document.",
     )
 
-    @property
+    @cached_property
     def as_str(self) -> str:
         sections = "\n\n".join(section.as_str for section in self.sections)
         return f"# {self.document_title}\n\n## Research Document Description\n{self.document_description}\n\n{sections}".strip()
 
-class Expert(BaseModel):
+class Expert(_RenderedModel):
     name: str = Field(
         description="Name of the expert."
     )
@@ -50,7 +63,7 @@ class Expert(BaseModel):
         description="Expert's role for the given research project, including their focus, concerns, motives, ideologies, etc.",
     )
 
-    @property
+    @cached_property
     def as_str(self) -> str:
         return f"Name: {self.name}\nProfession: {self.profession}\nRole: {self.role}\n"
 
@@ -60,12 +73,12 @@ class Perspectives(BaseModel):
         description="Comprehensive list of experts with their roles and affiliations."
     )
 
-class ContentSection(BaseModel):
+class ContentSection(_RenderedModel):
     section_title: str = Field(title="Title of the section")
     content: str = Field(title="Full content of the section")
     citations: List[str] = Field(default_factory=list, description="List of citations for the content")
 
-    @property
+    @cached_property
     def as_str(self) -> str:
         citations = [
             str(citation).strip()
@@ -73,19 +86,19 @@ class ContentSection(BaseModel):
             if str(citation).strip()
         ]
         citation_block = "\n".join([f"[{i}] {cit}" for i, cit in enumerate(citations, start=1)])
-        body = f"## {self.section_title}\n\n{self.content}".strip().strip("#").strip("#").strip()
+        body = f"## {self.section_title}\n\n{self.content}".strip().strip("#").strip()
         if not citation_block:
             return body
         return f"{body}\n\n{citation_block}".strip()
 
-class CompleteDocument(BaseModel):
+class CompleteDocument(_RenderedModel):
     title: str = Field(title="Title of the document")
     sections: List[ContentSection] = Field(
         default_factory=list,
         title="Sections of the document",
     )
 
-    @property
+    @cached_property
     def as_str(self) -> str:
         sections = [
             f"## {section.section_title}\n\n{section.content}".strip()
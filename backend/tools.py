@@ -1,9 +1,12 @@
 import asyncio
-from typing import Any
+import hashlib
+import logging
+from typing import Any, ClassVar
 
-from langchain_core.tools import tool, BaseTool
+from cachetools import LRUCache
+from langchain_core.tools import BaseTool, StructuredTool
 from langchain_core.documents import Document
-from langchain_google_genai import ChatGoogleGenerativeAI
+from pydantic import BaseModel
 
 from custom_search import CustomSearch
 from scrape import Scrape
@@ -11,8 +14,23 @@ from database import Database
 from nodes import Nodes
 from pdf_processing import PdfProcessingService
 from settings import build_langsmith_thread_config, get_settings
+from shared_models import get_summary_model
+
+logger = logging.getLogger(__name__)
+
+
+# Declared once so building the tools per request skips signature introspection.
+class _QueryArgs(BaseModel):
+    query: str
+
+
+class _UrlArgs(BaseModel):
+    url: str
+
 
 class Tools:
+    # Experts often pull the same long page; reuse its summary across sessions.
+    _summary_cache: ClassVar[LRUCache[str, str]] = LRUCache(maxsize=256)
 
     def __init__(
         self,
@@ -26,14 +44,14 @@ class Tools:
         self.__database = database
         self.__session_id = session_id
         self.__thread_config = build_langsmith_thread_config(session_id)
-        self.__model = ChatGoogleGenerativeAI(model = "models/gemini-flash-lite-latest")
-        self.__nodes = Nodes()
+        self.__model = get_summary_model()
         self.__pdf_processor = PdfProcessingService(
             session_id=session_id,
             database=database,
         )
-        self.__scrape = Scrape(browser, pdf_processor=self.__pdf_processor)
+        self.__scrape = Scrape(browser, session_id, pdf_processor=self.__pdf_processor)
         self.__web_search_total_timeout_seconds = settings.web_search_total_timeout_seconds
+        self.__persist_tasks: set[asyncio.Task[None]] = set()
         self.__scrape_timeout_seconds = settings.web_search_scrape_timeout_seconds
         if research_depth == "low":
             self.__min_web_documents_before_stop = settings.min_web_documents_low
@@ -85,16 +103,8 @@ class Tools:
             print(f"Skipping {url}: {error}")
             return None
 
-    async def __get_doc_summary(self, document: Document) -> str | None:
-        if len(document.page_content.split()) < 3000:
-            return document.page_content
-        try:
-            summary = await self.__model.ainvoke(
-                self.__nodes.generate_rolling_summary(document.page_content),
-                config=self.__thread_config,
-            )
-        except Exception:
-            return None
+    @staticmethod
+    def __summary_text(summary: Any) -> str:
         text = getattr(summary, "text", None)
         if isinstance(text, str) and text.strip():
             return text.strip()
@@ -118,6 +128,37 @@ class Tools:
 
         return str(content).strip()
 
+    async def __get_doc_summaries(self, documents: list[Document]) -> list[str | None]:
+        summaries: list[str | None] = [document.page_content for document in documents]
+        pending: dict[str, list[int]] = {}
+        for index, document in enumerate(documents):
+            if len(document.page_content.split()) < 3000:
+                continue
+            key = hashlib.sha256(document.page_content.encode("utf-8")).hexdigest()
+            cached = Tools._summary_cache.get(key)
+            if cached is not None:
+                summaries[index] = cached
+            else:
+                pending.setdefault(key, []).append(index)
+        if not pending:
+            return summaries
+
+        responses = await self.__model.abatch(
+            [
+                Nodes.generate_rolling_summary(documents[indexes[0]].page_content)
+                for indexes in pending.values()
+            ],
+            config=self.__thread_config,
+            return_exceptions=True,
+        )
+        for (key, indexes), response in zip(pending.items(), responses):
+            summary = None if isinstance(response, Exception) else self.__summary_text(response)
+            if summary:
+                Tools._summary_cache[key] = summary
+            for index in indexes:
+                summaries[index] = summary
+        return summaries
+
     @staticmethod
     def __doc_metadata(document: Document) -> dict:
         metadata = document.metadata if isinstance(document.metadata, dict) else {}
@@ -132,20 +173,28 @@ class Tools:
             flattened[key] = value
         return flattened
 
-    def __doc_meta_value(self, document: Document, key: str, default: str = "None") -> str:
-        metadata = self.__doc_metadata(document)
+    @staticmethod
+    def __meta_value(metadata: dict, key: str, default: str = "None") -> str:
         value = metadata.get(key)
         if value is None:
             return default
         value_str = str(value).strip()
         return value_str if value_str else default
 
+    def __render_document(self, document: Document, content: str) -> str:
+        metadata = self.__doc_metadata(document)
+        return (
+            f"Title: {self.__meta_value(metadata, 'title')}\n"
+            f"Content:{content}\n"
+            f"Source: {self.__meta_value(metadata, 'source')}"
+        )
+
     async def __render_web_documents(self, documents: list[Document], summarize: bool = True) -> str:
         if not documents:
             return "Search results were found, but no scrapeable page content was extracted."
 
         if summarize:
-            summaries = await asyncio.gather(*[self.__get_doc_summary(doc) for doc in documents])
+            summaries = await self.__get_doc_summaries(documents)
         else:
             summaries = [doc.page_content for doc in documents]
 
@@ -157,11 +206,7 @@ class Tools:
             summary_text = str(summary_text or "").strip()
             if not summary_text:
                 continue
-            rendered_rows.append(
-                f"Title: {self.__doc_meta_value(doc, 'title')}\n"
-                f"Content:{summary_text}\n"
-                f"Source: {self.__doc_meta_value(doc, 'source')}"
-            )
+            rendered_rows.append(self.__render_document(doc, summary_text))
 
         if not rendered_rows:
             return "Search results were found, but no scrapeable page content was extracted."
@@ -182,12 +227,26 @@ class Tools:
         min_documents_before_stop = self.__min_web_documents_before_stop
         max_documents = 5
 
+        # Pages already stored for this session are served from the vector
+        # store instead of being scraped and embedded again.
+        try:
+            stored_documents = await self.__database.stored_source_documents(
+                self.__session_id,
+                list(__urls.keys()),
+            )
+        except Exception as error:
+            logger.warning("Could not check stored sources before scraping: %s", error)
+            stored_documents = {}
+
         scrape_tasks = {
             asyncio.create_task(
                 self.__scrape_with_timeout(url, title, per_url_timeout_seconds)
             ): url
             for url, title in __urls.items()
+            if url not in stored_documents
         }
+        if not scrape_tasks:
+            return await self.__render_web_documents(list(stored_documents.values()), summarize=True)
 
         documents: list[Document] = []
         seen_sources: set[str] = set()
@@ -244,17 +303,34 @@ class Tools:
                 await asyncio.gather(*pending, return_exceptions=True)
 
         if not documents:
+            if stored_documents:
+                return await self.__render_web_documents(list(stored_documents.values()), summarize=True)
             return "Search results were found, but no scrapeable page content was extracted."
 
-        await self.__database.add_data(self.__session_id, documents)
+        persist_task = asyncio.create_task(self.__persist_web_documents(documents))
+        self.__persist_tasks.add(persist_task)
+        persist_task.add_done_callback(self.__persist_tasks.discard)
         if runtime_state is not None:
-            runtime_state["persisted"] = True
-        return await self.__render_web_documents(documents, summarize=True)
+            runtime_state["persisting"] = True
+
+        rendered_documents = await self.__render_web_documents(
+            [*documents, *stored_documents.values()],
+            summarize=True,
+        )
+        # Return once the chunks are searchable; a timeout here leaves the write running.
+        await asyncio.shield(persist_task)
+        return rendered_documents
+
+    async def __persist_web_documents(self, documents: list[Document]) -> None:
+        try:
+            await self.__database.add_data(self.__session_id, documents)
+        except Exception as error:
+            logger.warning("Could not store web search results for session %s: %s", self.__session_id, error)
 
     async def web_search_tool(self, query: str) -> str:
         """Web Search tool to access documents from the web based on the given search query"""
         partial_documents: list[Document] = []
-        runtime_state = {"persisted": False}
+        runtime_state = {"persisting": False}
         try:
             return await asyncio.wait_for(
                 self.__web_search_impl(
@@ -267,7 +343,7 @@ class Tools:
         except asyncio.TimeoutError:
             print(f"Web search tool exceeded total timeout of {self.__web_search_total_timeout_seconds:.0f}s.")
             if partial_documents:
-                if not runtime_state.get("persisted", False):
+                if not runtime_state.get("persisting", False):
                     try:
                         await self.__database.add_data(self.__session_id, partial_documents)
                     except Exception:
@@ -283,19 +359,20 @@ class Tools:
             return f"An error occured: {str(e)}"
     
     async def url_search_tool(self, url: str) -> str:
-        """URL Search tool to access documents from the web based on the given URL"""
+        """URL Search tool to access documents from the web based on the given URL. Pages longer than about 3000 words are returned as a summary; the full text is added to the vector store"""
         try:
             document = await asyncio.wait_for(
                 self.__scrape.scrape(url),
                 timeout=self.__scrape_timeout_seconds,
             )
             if document is not None and document.page_content is not None and document.page_content.strip() != "":
-                await self.__database.add_data(self.__session_id, [document])
-                return (
-                    f"Title: {self.__doc_meta_value(document, 'title')}\n"
-                    f"Content:{document.page_content}\n"
-                    f"Source: {self.__doc_meta_value(document, 'source')}"
+                # Long pages are summarised like web search results so a single
+                # page cannot blow up the agent's context.
+                _, rendered_document = await asyncio.gather(
+                    self.__database.add_data(self.__session_id, [document]),
+                    self.__render_web_documents([document], summarize=True),
                 )
+                return rendered_document
             else:
                 return "No content found at the provided URL."
         except asyncio.TimeoutError:
@@ -316,13 +393,23 @@ class Tools:
                 return "No relevant documents found in the vector store."
 
             return "\n----------------\n".join(
-                [
-                    f"Title: {self.__doc_meta_value(doc, 'title')}\nContent:{doc.page_content}\nSource: {self.__doc_meta_value(doc, 'source')}"
-                    for doc in documents
-                ]
+                [self.__render_document(doc, doc.page_content) for doc in documents]
             )
         except Exception as e:
             return f"An error occured: {str(e)}"
     
+    @staticmethod
+    def __as_tool(coroutine: Any, args_schema: type[BaseModel]) -> BaseTool:
+        return StructuredTool.from_function(
+            coroutine=coroutine,
+            name=coroutine.__name__,
+            description=coroutine.__doc__,
+            args_schema=args_schema,
+        )
+
     def return_tools(self) -> list[BaseTool]:
-        return [tool(self.vector_search_tool), tool(self.web_search_tool), tool(self.url_search_tool)]
+        return [
+            self.__as_tool(self.vector_search_tool, _QueryArgs),
+            self.__as_tool(self.web_search_tool, _QueryArgs),
+            self.__as_tool(self.url_search_tool, _UrlArgs),
+        ]